@@ -2142,11 +2142,14 @@ async def validate_website_endpoint(
         from website_validator import WebsiteValidator
         validator = WebsiteValidator(openai_api_key=config.get("chatgpt", {}).get("api_key"))
         
-        validation_result = await validator.validate_company_website(
-            company_data,
-            solicitation_data,
-            enrichment_data={}
-        )
+        try:
+            validation_result = await validator.validate_company_website(
+                company_data,
+                solicitation_data,
+                enrichment_data={}
+            )
+        finally:
+            await validator.aclose()
         
         # Format response
         return {
@@ -2581,33 +2584,36 @@ async def full_pipeline(
         from website_validator import WebsiteValidator
         website_validator = WebsiteValidator()
         
-        for result in combined_results:
-            company = result['company']
-            company_website = company.get('website', '')
-            
-            # CRITICAL: Filter out companies without websites
-            is_valid, error_msg = is_valid_website_url(company_website)
-            if not is_valid:
-                companies_filtered += 1
-                logger.info(f"⚠ Filtering out {company.get('name', 'Unknown')}: {error_msg}")
-                continue
-            
-            # Quick first-page validation to check if URL has meaningful content
-            try:
-                url_has_content = await website_validator.quick_validate_website_url(company_website)
-                if not url_has_content:
+        try:
+            for result in combined_results:
+                company = result['company']
+                company_website = company.get('website', '')
+                
+                # CRITICAL: Filter out companies without websites
+                is_valid, error_msg = is_valid_website_url(company_website)
+                if not is_valid:
                     companies_filtered += 1
-                    logger.info(f"⚠ Filtering out {company.get('name', 'Unknown')}: Website URL {company_website} has no valid content")
+                    logger.info(f"⚠ Filtering out {company.get('name', 'Unknown')}: {error_msg}")
                     continue
                 
-                # Website has valid content - include in results
-                result['website_url_validated'] = True
-                validated_results.append(result)
-            except Exception as e:
-                # If validation fails, filter out to be safe
-                companies_filtered += 1
-                logger.warning(f"⚠ Filtering out {company.get('name', 'Unknown')}: Website validation error: {e}")
-                continue
+                # Quick first-page validation to check if URL has meaningful content
+                try:
+                    url_has_content = await website_validator.quick_validate_website_url(company_website)
+                    if not url_has_content:
+                        companies_filtered += 1
+                        logger.info(f"⚠ Filtering out {company.get('name', 'Unknown')}: Website URL {company_website} has no valid content")
+                        continue
+                    
+                    # Website has valid content - include in results
+                    result['website_url_validated'] = True
+                    validated_results.append(result)
+                except Exception as e:
+                    # If validation fails, filter out to be safe
+                    companies_filtered += 1
+                    logger.warning(f"⚠ Filtering out {company.get('name', 'Unknown')}: Website validation error: {e}")
+                    continue
+        finally:
+            await website_validator.aclose()
         
         logger.info(f"✅ URL validation complete: {len(validated_results)} companies with valid website content (filtered out {companies_filtered})")
         
@@ -0,0 +1,1301 @@
+"""
+Unit tests for website validator caching and helpers
+"""
+import json
+
+import httpx
+import pytest
+import website_validator
+from website_validator import WebsiteValidator, _normalize_url
+
+
+SAMPLE_HTML = """
+<html><head><title>Acme Engineering</title></head>
+<body>
+<h1>Acme Engineering Services</h1>
+<p>We provide systems engineering, cybersecurity consulting and cloud
+infrastructure management for federal agencies and commercial customers
+across the United States.</p>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def no_ai_disk_cache(monkeypatch):
+    """Keep a developer's AI_CACHE_PATH from serving stored responses to tests"""
+    monkeypatch.delenv("AI_CACHE_PATH", raising=False)
+
+
+@pytest.fixture
+def mock_transport(monkeypatch):
+    """Route validator HTTP traffic through an httpx.MockTransport handler"""
+    real_client = httpx.AsyncClient
+
+    def install(handler):
+        def factory(*args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            return real_client(*args, **kwargs)
+        monkeypatch.setattr(website_validator.httpx, "AsyncClient", factory)
+
+    return install
+
+
+class TestUrlNormalization:
+    """Test suite for cache key normalization"""
+
+    def test_normalize_url_lowercases_host_and_strips_slash(self):
+        """Test scheme/host lowercasing and trailing slash removal"""
+        assert _normalize_url("HTTPS://Example.COM/About/") == "https://example.com/About"
+
+    def test_normalize_url_adds_scheme(self):
+        """Test bare domains get https scheme"""
+        assert _normalize_url("example.com") == "https://example.com"
+
+    def test_normalize_url_strips_default_port(self):
+        """Test default ports are dropped so equivalent URLs share a key"""
+        assert _normalize_url("https://example.com:443/") == _normalize_url("https://example.com")
+        assert _normalize_url("http://example.com:8080") == "http://example.com:8080"
+
+
+    async def test_quick_validate_rejects_bad_hosts(self, monkeypatch):
+        """Test host checks run on the parsed hostname, not the raw string"""
+        validator = WebsiteValidator()
+
+        async def fake_fetch(url):
+            return True
+
+        monkeypatch.setattr(validator, "_quick_validate_fetch", fake_fetch)
+        assert await validator.quick_validate_website_url("localhost/page.html") is False
+        assert await validator.quick_validate_website_url("https://example.c/x") is False
+        assert await validator.quick_validate_website_url("http://[bad") is False
+        assert await validator.quick_validate_website_url("Example.com:8080/about?x=1") is True
+
+
+class TestValidationCache:
+    """Test suite for quick validation and crawl result caching"""
+
+    async def test_quick_validate_uses_cache(self, monkeypatch):
+        """Test repeated quick validation of the same site fetches once"""
+        validator = WebsiteValidator()
+        calls = []
+
+        async def fake_fetch(url):
+            calls.append(url)
+            return True
+
+        monkeypatch.setattr(validator, "_quick_validate_fetch", fake_fetch)
+
+        assert await validator.quick_validate_website_url("example.com") is True
+        assert await validator.quick_validate_website_url("https://EXAMPLE.com/") is True
+        assert len(calls) == 1
+
+    async def test_quick_validate_caches_negative_results(self, monkeypatch):
+        """Test failed validations are cached too"""
+        validator = WebsiteValidator()
+        calls = []
+
+        async def fake_fetch(url):
+            calls.append(url)
+            return False
+
+        monkeypatch.setattr(validator, "_quick_validate_fetch", fake_fetch)
+
+        assert await validator.quick_validate_website_url("example.com") is False
+        assert await validator.quick_validate_website_url("example.com") is False
+        assert len(calls) == 1
+
+    async def test_quick_validate_retries_transient_failures(self, mock_transport):
+        """Test timeouts report invalid but are not cached"""
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            if len(calls) == 1:
+                raise httpx.ConnectTimeout("slow", request=request)
+            if request.method == "HEAD":
+                return httpx.Response(200, headers={"content-type": "text/html"})
+            return httpx.Response(200, text=SAMPLE_HTML)
+
+        mock_transport(handler)
+        validator = WebsiteValidator()
+
+        assert await validator.quick_validate_website_url("example.com") is False
+        assert await validator.quick_validate_website_url("example.com") is True
+        assert calls == ["HEAD", "HEAD", "GET"]
+
+    @pytest.mark.parametrize("status", [408, 429, 502, 503])
+    async def test_quick_validate_retries_transient_statuses(self, mock_transport, status):
+        """Test rate limiting and server errors are not cached as invalid"""
+        failing = [True]
+
+        def handler(request):
+            if failing[0]:
+                return httpx.Response(status)
+            if request.method == "HEAD":
+                return httpx.Response(200, headers={"content-type": "text/html"})
+            return httpx.Response(200, text=SAMPLE_HTML)
+
+        mock_transport(handler)
+        validator = WebsiteValidator()
+
+        assert await validator.quick_validate_website_url("example.com") is False
+        failing[0] = False
+        assert await validator.quick_validate_website_url("example.com") is True
+
+    async def test_quick_validate_caches_missing_pages(self, mock_transport):
+        """Test a definite 404 is cached"""
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(404)
+
+        mock_transport(handler)
+        validator = WebsiteValidator()
+
+        assert await validator.quick_validate_website_url("example.com") is False
+        assert await validator.quick_validate_website_url("example.com") is False
+        assert calls == ["HEAD"]
+
+    def test_cache_expires_after_ttl(self, monkeypatch):
+        """Test entries older than the TTL are evicted on read"""
+        validator = WebsiteValidator()
+        validator._cache_put(validator._quick_cache, "https://example.com", True)
+
+        monkeypatch.setattr(website_validator, "_CACHE_TTL", -1)
+        assert validator._cache_get(validator._quick_cache, "https://example.com") is None
+        assert "https://example.com" not in validator._quick_cache
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """Test cache size stays bounded"""
+        monkeypatch.setattr(website_validator, "_CACHE_MAX_ENTRIES", 2)
+        validator = WebsiteValidator()
+
+        validator._cache_put(validator._quick_cache, "a", True)
+        validator._cache_put(validator._quick_cache, "b", True)
+        validator._cache_get(validator._quick_cache, "a")
+        validator._cache_put(validator._quick_cache, "c", True)
+
+        assert list(validator._quick_cache) == ["a", "c"]
+
+
+class TestQuickValidationProbe:
+    """Test suite for the HEAD probe in quick validation"""
+
+    async def test_boilerplate_page_rejected(self, mock_transport):
+        """Test quick validation applies the same boilerplate markers as deep validation"""
+        html = SAMPLE_HTML.replace("</p>", " This page is empty.</p>")
+        mock_transport(lambda request: httpx.Response(200, headers={"content-type": "text/html"}, text=html))
+        assert await WebsiteValidator().quick_validate_website_url("empty.example.com") is False
+
+    @pytest.mark.parametrize("value", ["None", " N/A ", "undefined", "null"])
+    async def test_placeholder_values_rejected(self, value):
+        """Test placeholder website values are rejected without a request"""
+        assert await WebsiteValidator().quick_validate_website_url(value) is False
+
+    async def test_dead_url_skips_get(self, mock_transport):
+        """Test a 404 on HEAD rejects the URL without downloading the page"""
+        methods = []
+
+        def handler(request):
+            methods.append(request.method)
+            return httpx.Response(404)
+
+        mock_transport(handler)
+        assert await WebsiteValidator().quick_validate_website_url("dead.example.com") is False
+        assert methods == ["HEAD"]
+
+    async def test_non_html_rejected_on_head(self, mock_transport):
+        """Test non-HTML content types are rejected from headers alone"""
+        methods = []
+
+        def handler(request):
+            methods.append(request.method)
+            return httpx.Response(200, headers={"content-type": "application/pdf"})
+
+        mock_transport(handler)
+        assert await WebsiteValidator().quick_validate_website_url("pdf.example.com") is False
+        assert methods == ["HEAD"]
+
+    async def test_head_ok_then_get(self, mock_transport):
+        """Test a successful HEAD is followed by a full GET"""
+        methods = []
+
+        def handler(request):
+            methods.append(request.method)
+            return httpx.Response(200, headers={"content-type": "text/html"}, text=SAMPLE_HTML)
+
+        mock_transport(handler)
+        assert await WebsiteValidator().quick_validate_website_url("acme.example.com") is True
+        assert methods == ["HEAD", "GET"]
+
+    @pytest.mark.parametrize("head_status", [403, 405, 501, 503])
+    async def test_head_refused_falls_back_to_ranged_get(self, mock_transport, head_status):
+        """Test servers or WAFs rejecting HEAD get a ranged GET instead"""
+        ranges = []
+
+        def handler(request):
+            if request.method == "HEAD":
+                return httpx.Response(head_status)
+            ranges.append(request.headers.get("range"))
+            return httpx.Response(206, headers={"content-type": "text/html"}, text=SAMPLE_HTML)
+
+        mock_transport(handler)
+        assert await WebsiteValidator().quick_validate_website_url("nohead.example.com") is True
+        assert ranges == ["bytes=0-8192"]
+
+    async def test_gone_on_head_skips_get(self, mock_transport):
+        """Test 410 on HEAD is trusted as a definite rejection"""
+        methods = []
+
+        def handler(request):
+            methods.append(request.method)
+            return httpx.Response(410)
+
+        mock_transport(handler)
+        assert await WebsiteValidator().quick_validate_website_url("gone.example.com") is False
+        assert methods == ["HEAD"]
+
+    async def test_client_shared_across_validations(self, monkeypatch):
+        """Test one pooled client serves every request until aclose()"""
+        real_client = httpx.AsyncClient
+        created = []
+
+        def factory(*args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(
+                lambda request: httpx.Response(200, headers={"content-type": "text/html"}, text=SAMPLE_HTML)
+            )
+            client = real_client(*args, **kwargs)
+            created.append(client)
+            return client
+
+        monkeypatch.setattr(website_validator.httpx, "AsyncClient", factory)
+        validator = WebsiteValidator()
+        assert await validator.quick_validate_website_url("one.example.com") is True
+        assert await validator.quick_validate_website_url("two.example.com") is True
+        await validator.aclose()
+
+        assert len(created) == 1
+        assert created[0].is_closed
+        assert validator._client is None
+
+    async def test_client_keeps_environment_proxies(self, monkeypatch):
+        """Test the shared client uses httpx's default transport so proxy env vars apply"""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+        validator = WebsiteValidator()
+        client = validator._get_client()
+
+        assert client.timeout.connect == 3.0
+        assert any(pattern.matches(httpx.URL("https://acme.example.com")) for pattern in client._mounts)
+        await validator.aclose()
+
+
+class TestPageFetch:
+    """Test suite for streamed page fetching in the crawler"""
+
+    async def test_fetch_page_skips_non_html(self):
+        """Test non-HTML responses are skipped before reading the body"""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, headers={"content-type": "application/zip"}, content=b"PK")
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            assert await WebsiteValidator()._fetch_page(client, "https://example.com/file") is None
+
+    async def test_fetch_page_skips_oversized(self):
+        """Test responses declaring a huge Content-Length are skipped"""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(
+                200, headers={"content-type": "text/html", "content-length": "5000000"}, content=b"<html></html>"
+            )
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            assert await WebsiteValidator()._fetch_page(client, "https://example.com/") is None
+
+    async def test_fetch_page_caps_body_size(self, monkeypatch):
+        """Test page bodies are truncated at the byte cap"""
+        monkeypatch.setattr(website_validator, "_MAX_PAGE_BYTES", 1000)
+        body = b"<html><body>" + b"x" * 500_000 + b"</body></html>"
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, headers={"content-type": "text/html"}, content=body)
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            final_url, html = await WebsiteValidator()._fetch_page(client, "https://example.com/")
+
+        assert final_url == "https://example.com/"
+        assert html.startswith("<html><body>")
+        assert len(html) < len(body)
+
+
+class TestContentScanning:
+    """Test suite for boilerplate and priority-link pattern scanning"""
+
+    def _aggregated(self, text):
+        return {
+            "main_text": text,
+            "total_content_length": len(text),
+            "headings": ["Home", "Services"],
+            "pages_crawled": 1,
+        }
+
+    def test_real_content_passes(self):
+        """Test varied content with a stray boilerplate phrase is accepted"""
+        text = " ".join(f"word{i}" for i in range(100)) + " page not found"
+        assert WebsiteValidator()._validate_content_quality(self._aggregated(text)) is True
+
+    def test_mostly_boilerplate_rejected(self):
+        """Test pages matching several boilerplate patterns are rejected"""
+        text = " ".join(f"word{i}" for i in range(100)) + " Coming soon. Under construction. 404 page not found"
+        assert WebsiteValidator()._validate_content_quality(self._aggregated(text)) is False
+
+    def test_long_content_skips_boilerplate_scan(self):
+        """Test long, varied pages pass even when they mention boilerplate phrases"""
+        text = " ".join(f"word{i}" for i in range(400)) + " Coming soon. Under construction. 404 page not found"
+        data = self._aggregated(text)
+        data["main_text_lower"] = text.lower()
+        assert WebsiteValidator()._validate_content_quality(data) is True
+
+    def test_diversity_sampled_from_leading_words(self):
+        """Test repetitive text is still rejected on the sampled prefix"""
+        text = "spam " * 5000
+        assert WebsiteValidator()._validate_content_quality(self._aggregated(text)) is False
+
+    def test_priority_links_first(self):
+        """Test service/about links are ordered ahead of other internal links"""
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(
+            '<a href="/blog">Blog</a><a href="/Services">Services</a>'
+            '<a href="https://other.com/about">Other</a><a href="/about-us#team">About</a>',
+            "html.parser",
+        )
+        links = WebsiteValidator()._extract_internal_links(soup, "https://acme.com", "https://acme.com/")
+        assert links == ["https://acme.com/Services", "https://acme.com/about-us", "https://acme.com/blog"]
+
+    def test_duplicate_links_collapsed_in_order(self):
+        """Test repeated anchors (fragments/queries aside) yield one link, first occurrence kept"""
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(
+            '<a href="/blog?page=2">Blog</a><a href="/team">Team</a>'
+            '<a href="/blog#top">Blog</a><a href="https://acme.com/team">Team</a>' * 50,
+            "html.parser",
+        )
+        links = WebsiteValidator()._extract_internal_links(soup, "https://acme.com", "https://acme.com/")
+        assert links == ["https://acme.com/blog", "https://acme.com/team"]
+
+
+class TestPageParsing:
+    """Test suite for page parsing outside the event loop"""
+
+    def test_parse_page_extracts_fields(self):
+        """Test the picklable page parser returns plain page data"""
+        html = SAMPLE_HTML.replace("</body>", '<a href="/services">Services</a></body>')
+        page = website_validator._parse_page(html, "https://acme.com/", "https://acme.com", True)
+
+        assert page["title"] == "Acme Engineering"
+        assert type(page["title"]) is str
+        assert page["headings"] == ["Acme Engineering Services"]
+        assert "systems engineering" in page["main_text"]
+        assert page["links"] == ["https://acme.com/services"]
+        assert page["main_text_lower"] == page["main_text"].lower()
+
+    def test_main_text_strips_non_content(self):
+        """Test scripts, embeds and page chrome are dropped and whitespace collapsed"""
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(
+            "<header>Menu</header><p>Real   content\n here</p><script>var x;</script>"
+            "<noscript>Enable JS</noscript><svg><text>logo</text></svg><footer>(c)</footer>",
+            "html.parser",
+        )
+        assert WebsiteValidator._extract_main_text(soup) == "Real content here"
+
+    def test_main_text_truncated(self):
+        """Test main text stops at the length limit"""
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup("<p>word</p>" * 5000, "html.parser")
+        assert len(WebsiteValidator._extract_main_text(soup)) == website_validator._MAX_MAIN_TEXT
+
+    def test_asset_links_skipped(self):
+        """Test links to PDFs, images and archives are never queued"""
+        html = SAMPLE_HTML.replace(
+            "</body>",
+            '<a href="/brochure.PDF">PDF</a><a href="/logo.png">Logo</a>'
+            '<a href="/kit.zip">Kit</a><a href="/about">About</a></body>',
+        )
+        page = website_validator._parse_page(html, "https://acme.com/", "https://acme.com", True)
+        assert page["links"] == ["https://acme.com/about"]
+
+    def test_parse_page_skips_links_at_max_depth(self):
+        """Test links are not extracted when the crawler won't follow them"""
+        page = website_validator._parse_page(SAMPLE_HTML, "https://acme.com/", "https://acme.com", False)
+        assert page["links"] == []
+
+
+SITE_PAGES = {
+    "/": """
+        <html><head><title>Acme</title></head><body>
+        <h1>Acme Engineering</h1><h2>Who we serve</h2>
+        <p>Acme delivers systems engineering, cybersecurity assessments, cloud migration
+        and data analytics programs for federal civilian and defense agencies nationwide.
+        Our engineers hold active clearances and support mission critical operations.</p>
+        <a href="/services">Services</a><a href="/brochure.pdf">Brochure</a>
+        </body></html>""",
+    "/services": """
+        <html><head><title>Services</title></head><body>
+        <h1>Our Services</h1><h2>Capabilities</h2>
+        <p>Zero trust architecture, incident response, continuous monitoring, DevSecOps
+        pipelines, machine learning model deployment and infrastructure modernization
+        delivered by certified practitioners with decades of combined experience.</p>
+        <a href="/">Home</a>
+        </body></html>""",
+}
+
+
+def site_handler(request):
+    """Serve SITE_PAGES as text/html; anything else is a PDF"""
+    body = SITE_PAGES.get(request.url.path)
+    if body is None:
+        return httpx.Response(200, headers={"content-type": "application/pdf"}, content=b"%PDF")
+    return httpx.Response(200, headers={"content-type": "text/html"}, text=body)
+
+
+class TestDeepCrawl:
+    """Test suite for the deep crawler"""
+
+    async def test_crawl_follows_internal_links(self, mock_transport):
+        """Test the crawler visits linked pages and aggregates their content"""
+        mock_transport(site_handler)
+        validator = WebsiteValidator()
+        try:
+            data = await validator._deep_crawl_website("https://acme.example.com/")
+        finally:
+            await validator.aclose()
+
+        assert data["accessible"] is True
+        assert data["content_validated"] is True
+        assert [p["url"] for p in data["pages"]] == [
+            "https://acme.example.com/", "https://acme.example.com/services"
+        ]
+
+    async def test_crawl_requests_each_page_once(self, mock_transport):
+        """Test pages linked repeatedly (including the bare start URL) are fetched once"""
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            return site_handler(request)
+
+        mock_transport(handler)
+        validator = WebsiteValidator()
+        try:
+            data = await validator._deep_crawl_website("acme.example.com")
+        finally:
+            await validator.aclose()
+
+        assert data["pages_crawled"] == 2
+        assert sorted(requests) == ["/", "/services"]
+
+    async def test_crawl_result_is_cached(self, mock_transport):
+        """Test a second crawl of the same site makes no requests"""
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            return site_handler(request)
+
+        mock_transport(handler)
+        validator = WebsiteValidator()
+        try:
+            first = await validator._deep_crawl_website("https://acme.example.com/")
+            count = len(requests)
+            second = await validator._deep_crawl_website("acme.example.com")
+        finally:
+            await validator.aclose()
+
+        assert second is first
+        assert len(requests) == count
+
+    async def test_host_rate_limit_spaces_requests(self, monkeypatch):
+        """Test requests to one host are spaced by 1/max_per_second"""
+        validator = WebsiteValidator(max_per_second=4.0)
+        waits = []
+
+        async def fake_sleep(delay):
+            waits.append(delay)
+
+        monkeypatch.setattr(website_validator.asyncio, "sleep", fake_sleep)
+        for _ in range(3):
+            await validator._wait_for_host_slot("acme.com")
+        await validator._wait_for_host_slot("other.com")
+
+        assert len(waits) == 2
+        assert waits[0] == pytest.approx(0.25, abs=0.05)
+        assert waits[1] == pytest.approx(0.5, abs=0.05)
+
+
+class TestWebsiteText:
+    """Test suite for the shared lowercased website text"""
+
+    WEBSITE_DATA = {
+        "title": "Acme",
+        "main_text": "We deliver Zero Trust architecture and ISO 27001 compliance.",
+        "services": "Cloud Migration",
+        "about": "",
+        "headings": ["DevSecOps Pipelines"],
+    }
+
+    def test_joined_text_built_once(self):
+        """Test the joined text is stored on the website data and reused"""
+        data = dict(self.WEBSITE_DATA)
+        text = WebsiteValidator._joined_website_text(data)
+        assert "zero trust" in text and "devsecops pipelines" in text and "cloud migration" in text
+        assert data["_joined_lower"] is text
+        assert WebsiteValidator._joined_website_text(data) is text
+
+    async def test_gaps_use_joined_text(self):
+        """Test claims found anywhere in the crawled text are not reported as gaps"""
+        company = {
+            "capabilities": ["Zero Trust", "Devsecops", "Quantum Computing"],
+            "certifications": ["ISO 27001", "CMMI Level 3"],
+        }
+        gaps = await WebsiteValidator()._identify_gaps(company, [], {}, dict(self.WEBSITE_DATA))
+        assert [gap.claimed_value for gap in gaps] == ["Quantum Computing", "CMMI Level 3"]
+
+    def test_find_terms_reports_overlapping_hits(self):
+        """Test every occurring term is found, including ones nested in longer matches"""
+        text = "we provide cloud computing and ci/cd pipelines"
+        terms = {"cloud", "cloud computing", "ci/cd", "quantum", ""}
+        assert website_validator._find_terms(text, terms) == {"cloud", "cloud computing", "ci/cd", ""}
+
+    async def test_per_call_needles_skip_automaton(self, monkeypatch):
+        """Test gap detection searches its per-call needles without building an automaton"""
+        def no_build(terms):
+            raise AssertionError("automaton built for per-call needles")
+
+        monkeypatch.setattr(website_validator, "_build_automaton", no_build)
+        company = {"capabilities": ["Zero Trust"], "certifications": ["ISO 27001"]}
+        gaps = await WebsiteValidator()._identify_gaps(company, [], {}, dict(self.WEBSITE_DATA))
+        assert gaps == []
+
+    def test_keyword_capabilities_single_scan(self):
+        """Test keyword extraction maps keyword hits back to canonical capabilities"""
+        data = {"main_text": "Our infosec team runs AWS workloads", "headings": ["Research and Development"]}
+        assert WebsiteValidator()._extract_capabilities_by_keywords(data) == [
+            "Cloud Computing", "Cybersecurity", "Research"
+        ]
+
+    def test_keyword_automaton_built_once(self, monkeypatch):
+        """Test keyword extraction reuses the import-time automaton"""
+        pytest.importorskip("ahocorasick")
+
+        def no_rebuild(terms):
+            raise AssertionError("capability keyword automaton rebuilt")
+
+        monkeypatch.setattr(website_validator, "_build_automaton", no_rebuild)
+        data = {"main_text": "Our infosec team runs AWS workloads", "headings": []}
+        assert WebsiteValidator()._extract_capabilities_by_keywords(data) == ["Cloud Computing", "Cybersecurity"]
+
+
+class TestHallucinationChecks:
+    """Test suite for evidence checks on AI alignment output"""
+
+    WEBSITE_DATA = {"main_text": "zero trust", "content_validated": True, "total_content_length": 5000}
+
+    def test_vague_terms_matched_as_words(self):
+        """Test vague hedges are flagged but words merely containing them are not"""
+        validator = WebsiteValidator()
+        vague = {"technical_evidence": ["They (may) support SIEM", "Likely, uses Splunk"]}
+        specific = {"technical_evidence": ["Mayor's office deployment", "Dismayed no one: 99.9% uptime"]}
+
+        assert validator._detect_hallucinations(vague, self.WEBSITE_DATA, {}) == pytest.approx(0.2)
+        assert validator._detect_hallucinations(specific, self.WEBSITE_DATA, {}) == 0.0
+
+    def test_unreferenced_matches_and_generic_evidence_penalized(self):
+        """Test matches without website evidence and boilerplate evidence add penalties"""
+        result = {
+            "capability_matches": [{"capability": "Quantum computing", "evidence": "Strong team"}],
+            "evidence_found": ["According to the website, they do it"],
+        }
+        penalty = WebsiteValidator()._detect_hallucinations(result, self.WEBSITE_DATA, {})
+        assert penalty == pytest.approx(0.3 + 0.2)
+
+        result["capability_matches"][0]["evidence"] = "Described on the services page"
+        assert WebsiteValidator()._detect_hallucinations(result, self.WEBSITE_DATA, {}) == pytest.approx(0.2)
+
+
+class TestCapabilityMatching:
+    """Test suite for token-based capability confirmation"""
+
+    def test_capability_tokens_normalized(self):
+        """Test punctuation, case and stopwords are removed"""
+        assert website_validator._capability_tokens("Research & Development, R&D") == frozenset(
+            {"research", "development", "r", "d"}
+        )
+
+    def test_confirms_contained_claims(self):
+        """Test claims contained in (or containing) a website capability are confirmed"""
+        company = {"capabilities": ["Cloud", "Systems Engineering Services", "Cloud Security", "Email Marketing"]}
+        website_caps = ["Cloud Computing", "Systems Engineering", "AI"]
+
+        confirmed = WebsiteValidator()._identify_confirmed_capabilities(company, website_caps)
+
+        assert confirmed == ["Cloud", "Systems Engineering Services"]
+
+    @pytest.mark.parametrize("claimed, website", [
+        ("Cloud Service", "Cloud Services"),
+        ("Data Analytic", "Data Analytics"),
+        ("Engineer", "Engineering"),
+        ("Business Processes", "Business Process Automation"),
+    ])
+    def test_plural_and_stem_variants_confirmed(self, claimed, website):
+        """Test plural and -ing variants of a website capability still confirm a claim"""
+        confirmed = WebsiteValidator()._identify_confirmed_capabilities({"capabilities": [claimed]}, [website])
+        assert confirmed == [claimed]
+
+    def test_uses_precomputed_tokens(self):
+        """Test precomputed capability tokens are used when supplied"""
+        validator = WebsiteValidator()
+        website_caps = ["Data Analytics"]
+        tokens = validator._tokenize_capabilities(website_caps)
+
+        confirmed = validator._identify_confirmed_capabilities({"capabilities": ["data"]}, website_caps, tokens)
+
+        assert confirmed == ["data"]
+
+    async def test_gaps_match_capabilities_by_tokens(self):
+        """Test claim/website/required comparisons in gap detection use token containment"""
+        company = {"capabilities": ["Cloud", "Quantum Sensing", "Email Campaigns"]}
+        solicitation = {"required_capabilities": ["Quantum Sensing Systems", "AI", "Cloud Security"]}
+        website_data = {"main_text": "Unrelated text", "headings": []}
+
+        gaps = await WebsiteValidator()._identify_gaps(
+            company, ["Cloud Computing", "Cloud Security"], solicitation, website_data
+        )
+
+        summary = [(gap.gap_type.value, gap.claimed_value, gap.severity) for gap in gaps]
+        assert summary == [
+            ("capability_missing", "Quantum Sensing", 0.8),
+            ("capability_missing", "Email Campaigns", 0.5),
+            ("technical_expertise_gap", "Not claimed", 1.0),
+        ]
+        assert "'AI'" in gaps[-1].description
+
+    async def test_plural_required_capability_not_a_gap(self):
+        """Test a claim that differs from a requirement only by plural raises no expertise gap"""
+        company = {"capabilities": ["Cloud Migration Service"]}
+        solicitation = {"required_capabilities": ["Cloud Migration Services"]}
+        website_data = {"main_text": "We run cloud migration service engagements", "headings": []}
+
+        gaps = await WebsiteValidator()._identify_gaps(company, [], solicitation, website_data)
+
+        assert gaps == []
+
+
+class FakeOpenAIClient:
+    """Minimal stand-in for openai.AsyncOpenAI recording chat completion requests"""
+
+    def __init__(self, content):
+        self.requests = []
+        self.streams = []
+        self.chat = self
+        self.completions = self
+        self._content = content
+
+    async def create(self, **request):
+        from types import SimpleNamespace
+        self.requests.append(request)
+        if request.get("stream"):
+            self.streams.append(FakeStream(self._content))
+            return self.streams[-1]
+        message = SimpleNamespace(content=self._content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeStream:
+    """Streams content in small deltas and records how much was consumed"""
+
+    def __init__(self, content, size=7):
+        self.deltas = [content[i:i + size] for i in range(0, len(content), size)]
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        from types import SimpleNamespace
+        if self.consumed == len(self.deltas):
+            raise StopAsyncIteration
+        delta = SimpleNamespace(content=self.deltas[self.consumed])
+        self.consumed += 1
+        return SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None)
+
+    async def close(self):
+        self.closed = True
+
+
+class TestAICompletionCache:
+    """Test suite for caching deterministic AI completions"""
+
+    async def test_capability_extraction_cached(self):
+        """Test identical website content is only sent to the model once"""
+        validator = WebsiteValidator()
+        validator.openai_client = FakeOpenAIClient("Cloud Migration, Zero Trust, DevSecOps")
+        website_data = {"title": "Acme", "main_text": "Acme does cloud migration", "pages_crawled": 1}
+
+        first = await validator._extract_capabilities_with_ai(website_data, "Acme")
+        second = await validator._extract_capabilities_with_ai(website_data, "Acme")
+
+        assert first == second == ["Cloud Migration", "Zero Trust", "DevSecOps"]
+        assert len(validator.openai_client.requests) == 1
+        assert validator.openai_client.requests[0]["temperature"] == 0
+
+    async def test_non_deterministic_requests_not_cached(self):
+        """Test sampled (temperature > 0) completions always call the model"""
+        validator = WebsiteValidator()
+        validator.openai_client = FakeOpenAIClient("ok")
+
+        for _ in range(2):
+            await validator._chat_completion(model="gpt-4o-mini", messages=[], temperature=0.7)
+
+        assert len(validator.openai_client.requests) == 2
+
+
+    async def test_concurrent_requests_bounded(self):
+        """Test in-flight OpenAI requests never exceed max_ai_concurrency"""
+        import asyncio
+
+        class SlowClient(FakeOpenAIClient):
+            in_flight = 0
+            peak = 0
+
+            async def create(self, **request):
+                SlowClient.in_flight += 1
+                SlowClient.peak = max(SlowClient.peak, SlowClient.in_flight)
+                await asyncio.sleep(0.01)
+                SlowClient.in_flight -= 1
+                return await super().create(**request)
+
+        validator = WebsiteValidator(max_ai_concurrency=2)
+        validator.openai_client = SlowClient("ok")
+        await asyncio.gather(*[
+            validator._chat_completion(model="gpt-4o-mini", messages=[], temperature=0.7) for _ in range(6)
+        ])
+
+        assert len(validator.openai_client.requests) == 6
+        assert SlowClient.peak == 2
+
+
+    async def test_disk_cache_survives_new_validator(self, tmp_path):
+        """Test persisted responses are reused by a fresh validator, including sampled requests"""
+        path = str(tmp_path / "ai_cache.db")
+        request = {"model": "gpt-3.5-turbo", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.7}
+
+        first = WebsiteValidator(ai_cache_path=path)
+        first.openai_client = FakeOpenAIClient("stored answer")
+        assert await first._chat_completion(**request) == "stored answer"
+
+        second = WebsiteValidator(ai_cache_path=path)
+        second.openai_client = FakeOpenAIClient("new answer")
+        assert await second._chat_completion(**request) == "stored answer"
+        assert second.openai_client.requests == []
+
+        assert await second._chat_completion(force_refresh=True, **request) == "new answer"
+        assert len(second.openai_client.requests) == 1
+
+    async def test_aclose_closes_disk_cache(self, tmp_path):
+        """Test closing a validator releases its SQLite connection"""
+        import sqlite3
+        validator = WebsiteValidator(ai_cache_path=str(tmp_path / "ai.db"))
+        connection = validator._ai_disk_cache._conn
+
+        await validator.aclose()
+
+        assert validator._ai_disk_cache is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+
+    def test_disk_cache_expires(self, tmp_path):
+        """Test entries older than the TTL are ignored"""
+        cache = website_validator.AIResponseCache(str(tmp_path / "ai_cache.db"), ttl=-1)
+        cache.put("key", "value")
+        assert cache.get("key") is None
+        cache.close()
+
+    def test_disk_cache_prunes_expired_rows(self, tmp_path):
+        """Test expired rows are deleted on open and on write"""
+        path = str(tmp_path / "ai_cache.db")
+        cache = website_validator.AIResponseCache(path)
+        cache.put("old", "value")
+        cache._conn.execute("UPDATE ai_responses SET stored_at = 0")
+        cache._conn.commit()
+        cache.put("new", "value")
+        assert [row[0] for row in cache._conn.execute("SELECT key FROM ai_responses")] == ["new"]
+        cache.close()
+
+        reopened = website_validator.AIResponseCache(path, ttl=-1)
+        assert reopened._conn.execute("SELECT COUNT(*) FROM ai_responses").fetchone()[0] == 0
+        reopened.close()
+
+
+class FakeSentenceTransformer:
+    """Embeds text as a normalized indicator vector over the canonical capability labels"""
+
+    def __init__(self, name):
+        self.labels = list(website_validator._CAPABILITY_KEYWORDS)
+
+    def encode(self, texts, normalize_embeddings=False):
+        vectors = []
+        for text in texts:
+            hits = [1.0 if label in text.lower() else 0.0 for label in self.labels]
+            norm = sum(hits) ** 0.5 or 1.0
+            vectors.append([hit / norm for hit in hits])
+        return vectors
+
+
+class TestLocalCapabilityClassifier:
+    """Test suite for embedding-based capability labelling"""
+
+    async def test_local_classifier_used_without_openai(self, monkeypatch):
+        """Test capabilities come from the local model when no OpenAI client is configured"""
+        monkeypatch.setattr(website_validator, "np", pytest.importorskip("numpy"))
+        monkeypatch.setattr(website_validator, "SentenceTransformer", FakeSentenceTransformer)
+        validator = WebsiteValidator()
+        validator.openai_client = None
+        website_data = {"main_text": "We lead devops transformations and cybersecurity programs", "headings": []}
+
+        capabilities = await validator._extract_website_capabilities(website_data, "Acme")
+
+        assert capabilities == ["Cybersecurity", "Devops"]
+
+    async def test_openai_client_preferred_over_local_model(self, monkeypatch):
+        """Test a configured OpenAI client is used and the local model is never loaded"""
+        def unused_model(name):
+            raise AssertionError("local model loaded despite an OpenAI client")
+
+        monkeypatch.setattr(website_validator, "SentenceTransformer", unused_model)
+        validator = WebsiteValidator()
+        validator._local_classifier_available = True
+        validator.openai_client = FakeOpenAIClient("Zero Trust")
+
+        capabilities = await validator._extract_website_capabilities({"main_text": "zero trust"}, "Acme")
+
+        assert capabilities == ["Zero Trust"]
+        assert len(validator.openai_client.requests) == 1
+
+    async def test_falls_back_to_keywords_when_model_fails(self, monkeypatch):
+        """Test a model that can't load disables the classifier and keeps keyword capabilities"""
+        def broken_model(name):
+            raise OSError("model download failed")
+
+        monkeypatch.setattr(website_validator, "SentenceTransformer", broken_model)
+        validator = WebsiteValidator()
+        validator.openai_client = None
+        validator._local_classifier_available = True
+
+        capabilities = await validator._extract_website_capabilities({"main_text": "devops pipelines"}, "Acme")
+
+        assert capabilities == ["Devops"]
+        assert validator._local_classifier_available is False
+
+    async def test_model_loaded_once_across_concurrent_companies(self, monkeypatch):
+        """Test concurrent classifications share a single model load"""
+        import asyncio
+        import time
+        monkeypatch.setattr(website_validator, "np", pytest.importorskip("numpy"))
+        loads = []
+
+        class SlowModel(FakeSentenceTransformer):
+            def __init__(self, name):
+                loads.append(name)
+                time.sleep(0.05)
+                super().__init__(name)
+
+        monkeypatch.setattr(website_validator, "SentenceTransformer", SlowModel)
+        validator = WebsiteValidator()
+        website_data = [{"main_text": f"devops program {i}"} for i in range(4)]
+
+        results = await asyncio.gather(*(validator._classify_capabilities_locally(data) for data in website_data))
+
+        assert results == [["Devops"]] * 4
+        assert len(loads) == 1
+
+
+class TestPromptLayout:
+    """Test suite for cache-friendly prompt ordering"""
+
+    async def test_alignment_prompt_puts_shared_context_first(self):
+        """Test instructions sit in the system message and the solicitation precedes company content"""
+        validator = WebsiteValidator()
+        validator.openai_client = FakeOpenAIClient("not json")
+        solicitation = {"title": "Zero Trust Modernization", "required_capabilities": ["Zero Trust"]}
+        website_data = {
+            "title": "Acme",
+            "main_text": "Acme builds zero trust networks",
+            "pages_crawled": 1,
+            "content_validated": True,
+            "total_content_length": 5000,
+        }
+
+        await validator._analyze_solicitation_alignment(website_data, solicitation, "Acme")
+
+        system, user = validator.openai_client.requests[0]["messages"]
+        assert "Provide a comprehensive analysis" in system["content"]
+        assert "Provide a comprehensive analysis" not in user["content"]
+        assert user["content"].index("Zero Trust Modernization") < user["content"].index("COMPANY: Acme")
+
+    async def test_capability_prompt_instructions_static(self):
+        """Test the capability system prompt does not vary with the company"""
+        validator = WebsiteValidator()
+        validator.openai_client = FakeOpenAIClient("Cloud Migration")
+
+        await validator._extract_capabilities_with_ai({"main_text": "cloud"}, "Acme")
+        await validator._extract_capabilities_with_ai({"main_text": "cyber"}, "Beta")
+
+        first, second = validator.openai_client.requests
+        assert first["messages"][0] == second["messages"][0]
+        assert "comma-separated" in first["messages"][0]["content"]
+        assert "10-15 specific capabilities" in first["messages"][0]["content"]
+
+
+class FakeBatchClient:
+    """Minimal stand-in for the OpenAI files/batches endpoints"""
+
+    def __init__(self, answer_for):
+        self.files = self
+        self.batches = self
+        self.uploaded = None
+        self.polls = 0
+        self._answer_for = answer_for
+
+    # files.create / batches.create share a name, so dispatch on keyword arguments
+    async def create(self, **kwargs):
+        from types import SimpleNamespace
+        if "purpose" in kwargs:
+            self.uploaded = kwargs["file"][1].decode()
+            return SimpleNamespace(id="file-in")
+        return SimpleNamespace(id="batch-1", status="validating", output_file_id=None)
+
+    async def retrieve(self, batch_id):
+        from types import SimpleNamespace
+        self.polls += 1
+        return SimpleNamespace(id=batch_id, status="completed", output_file_id="file-out")
+
+    async def content(self, file_id):
+        from types import SimpleNamespace
+        lines = []
+        for line in self.uploaded.splitlines():
+            request = json.loads(line)
+            answer = self._answer_for(request)
+            if answer is None:
+                continue
+            body = {"choices": [{"message": {"content": answer}}]}
+            lines.append(json.dumps({"custom_id": request["custom_id"], "response": {"body": body}}))
+        return SimpleNamespace(text="\n".join(lines))
+
+
+ALIGNMENT_RESPONSE = {
+    "overall_alignment_score": 0.8,
+    "capability_matches": [{"capability": "Cloud Migration", "evidence": "Services page", "confidence": 0.9}],
+    "capability_gaps": [],
+    "problem_area_coverage": [{"problem_area": "Legacy systems", "coverage": 0.7}],
+    "technical_evidence": ["Migrated 40 workloads to AWS GovCloud"],
+    "confidence": 0.9,
+}
+
+
+class TestStructuredAlignment:
+    """Test suite for schema-constrained alignment responses"""
+
+    async def test_request_uses_json_schema(self):
+        """Test the alignment request asks for structured output instead of prose JSON"""
+        validator = WebsiteValidator()
+        request = validator._build_alignment_request({"main_text": "cloud"}, {"title": "Cloud"}, "Acme")
+
+        assert request["response_format"]["type"] == "json_schema"
+        assert request["response_format"]["json_schema"]["strict"] is True
+        assert request["max_tokens"] == 1200
+        assert "Format as JSON" not in request["messages"][0]["content"]
+
+    def test_structured_response_parsed(self):
+        """Test parsed output keeps the problem-area mapping used downstream"""
+        website_data = {"main_text": "cloud migration", "content_validated": True, "total_content_length": 5000}
+        result = WebsiteValidator()._finalize_alignment(json.dumps(ALIGNMENT_RESPONSE), website_data, {})
+
+        assert result["problem_area_coverage"] == {"Legacy systems": 0.7}
+        assert result["capability_matches"][0]["capability"] == "Cloud Migration"
+        assert result["overall_alignment_score"] == pytest.approx(0.8 - result["hallucination_penalty"])
+
+    def test_unusable_response_falls_back(self):
+        """Test refusals or truncated output fall back to keyword alignment"""
+        result = WebsiteValidator()._finalize_alignment('{"overall_alignment_score": 0.9', {"main_text": ""}, {})
+        assert result["content_verified"] is True
+        assert result["hallucination_penalty"] == 0.0
+
+
+RICH_SITE = {"content_validated": True, "total_content_length": 5000}
+
+
+class TestPartneringOpportunities:
+    """Test suite for parsing AI partnering suggestions"""
+
+    GAPS = [website_validator.WebsiteGap(
+        website_validator.GapType.CAPABILITY_MISSING, "No cloud evidence", "Cloud Migration", "", 0.8
+    )]
+
+    async def test_fenced_json_array_parsed(self):
+        """Test a fenced JSON array is parsed into opportunity records"""
+        validator = WebsiteValidator()
+        answer = [{"gap": "Cloud", "partner_type": "Cloud integrator", "rationale": "Fills gap", "priority": "High"}]
+        validator.openai_client = FakeOpenAIClient("```json\n" + json.dumps(answer) + "\n```")
+
+        opportunities = await validator._generate_partnering_opportunities_with_ai(self.GAPS, {}, [])
+
+        assert opportunities == [{
+            "gap": "Cloud", "opportunity_type": "Cloud integrator", "suggestion": "Fills gap", "priority": "High"
+        }]
+
+    async def test_non_json_falls_back_to_text(self):
+        """Test prose answers are routed to the text parser"""
+        validator = WebsiteValidator()
+        validator.openai_client = FakeOpenAIClient("Partner with a cloud integrator")
+
+        opportunities = await validator._generate_partnering_opportunities_with_ai(self.GAPS, {}, [])
+
+        assert [opp["suggestion"] for opp in opportunities] == ["Partner with a cloud integrator"]
+        assert opportunities[0]["gap"] == "Cloud Migration"
+
+    async def test_suggestions_cached_by_gap_signature(self):
+        """Test companies with the same gaps and capabilities against a solicitation share one call"""
+        validator = WebsiteValidator()
+        validator.openai_client = FakeOpenAIClient('[{"gap": "Cloud", "partner_type": "Integrator"}]')
+        other_gap = website_validator.WebsiteGap(
+            website_validator.GapType.CAPABILITY_MISSING, "No zero trust evidence", "Zero Trust", "", 0.8
+        )
+        solicitation = {"title": "Cloud"}
+
+        first = await validator._generate_partnering_opportunities_with_ai(
+            self.GAPS + [other_gap], solicitation, ["Devops", "Cybersecurity"]
+        )
+        first[0]["priority"] = "Changed"
+        second = await validator._generate_partnering_opportunities_with_ai(
+            [other_gap] + self.GAPS, solicitation, ["cybersecurity", "Devops"]
+        )
+        await validator._generate_partnering_opportunities_with_ai(self.GAPS, solicitation, ["Devops", "Cybersecurity"])
+        await validator._generate_partnering_opportunities_with_ai(self.GAPS, solicitation, ["Devops"])
+
+        assert second[0]["priority"] == "Medium"
+        assert len(validator.openai_client.requests) == 3
+        assert validator.openai_client.requests[0]["model"] == "gpt-4o-mini"
+
+    async def test_prompt_lists_website_capabilities(self):
+        """Test the verified website capabilities reach the prompt"""
+        validator = WebsiteValidator()
+        validator.openai_client = FakeOpenAIClient("[]")
+
+        await validator._generate_partnering_opportunities_with_ai(self.GAPS, {"title": "Cloud"}, ["Devops", "Cybersecurity"])
+
+        prompt = validator.openai_client.requests[0]["messages"][1]["content"]
+        assert "Verified Website Capabilities:\nDevops, Cybersecurity" in prompt
+
+
+class TestStreamedJson:
+    """Test suite for stopping streamed JSON responses once the document closes"""
+
+    def test_scanner_ignores_braces_in_strings(self):
+        """Test quoted and escaped braces do not end the document early"""
+        scanner = website_validator._JsonEndScanner()
+        head = '```json\n{"a": "}{\\"}", "b": ['
+        assert scanner.feed(head) is None
+        assert scanner.feed('1, {"c": 2}]}  trailing') == len(head + '1, {"c": 2}]}')
+
+    def test_scanner_ignores_prose_replies(self):
+        """Test brackets inside a prose reply never end the stream"""
+        scanner = website_validator._JsonEndScanner()
+        assert scanner.feed("1. Partner with a cloud security firm [Critical]") is None
+        assert scanner.feed(" to strengthen the bid.\n2. Team with {anyone}") is None
+
+    async def test_stream_closed_after_json_ends(self):
+        """Test trailing output after the JSON array is never read"""
+        validator = WebsiteValidator()
+        answer = [{"gap": "Cloud", "partner_type": "Integrator", "rationale": "Fills gap", "priority": "High"}]
+        validator.openai_client = FakeOpenAIClient(json.dumps(answer) + "\n" * 200)
+
+        opportunities = await validator._generate_partnering_opportunities_with_ai(
+            TestPartneringOpportunities.GAPS, {}, []
+        )
+
+        assert opportunities[0]["opportunity_type"] == "Integrator"
+        stream = validator.openai_client.streams[0]
+        assert stream.closed
+        assert stream.consumed < len(stream.deltas)
+
+    async def test_prose_reply_read_in_full(self):
+        """Test a non-JSON partnering reply reaches the text parser intact"""
+        validator = WebsiteValidator()
+        reply = "1. Partner with a cloud security firm [Critical] to strengthen the bid.\n2. Team with a data integrator"
+        validator.openai_client = FakeOpenAIClient(reply)
+
+        opportunities = await validator._generate_partnering_opportunities_with_ai(
+            TestPartneringOpportunities.GAPS, {}, []
+        )
+
+        assert [opp["suggestion"] for opp in opportunities] == reply.split("\n")
+
+    async def test_alignment_not_streamed(self):
+        """Test the schema-constrained alignment call is a plain request (usage is kept)"""
+        validator = WebsiteValidator()
+        validator.openai_client = FakeOpenAIClient(json.dumps(ALIGNMENT_RESPONSE))
+
+        result = await validator._analyze_solicitation_alignment(
+            {"main_text": "cloud migration", **RICH_SITE}, {"title": "Cloud"}, "Acme"
+        )
+
+        assert result["problem_area_coverage"] == {"Legacy systems": 0.7}
+        assert "stream" not in validator.openai_client.requests[0]
+        assert validator.openai_client.streams == []
+
+
+class TestAlignmentBatch:
+    """Test suite for bulk alignment scoring through the Batch API"""
+
+    async def test_batch_maps_results_back_to_companies(self):
+        """Test one batch job scores every company and unanswered ones fall back to keywords"""
+        def answer_for(request):
+            user = request["body"]["messages"][1]["content"]
+            if "COMPANY: Beta" in user:
+                return None
+            return json.dumps(ALIGNMENT_RESPONSE)
+
+        validator = WebsiteValidator()
+        validator.openai_client = FakeBatchClient(answer_for)
+        solicitation = {"title": "Cloud Migration", "required_capabilities": ["Cloud Migration"]}
+        companies = [
+            {"name": "Acme", "website_data": dict(RICH_SITE, main_text="Acme performs cloud migration")},
+            {"name": "Beta", "website_data": dict(RICH_SITE, main_text="Beta performs cloud migration")},
+            {"name": "Thin", "website_data": {"main_text": "cloud", "content_validated": True, "total_content_length": 5}},
+        ]
+
+        results = await validator.analyze_solicitation_alignment_batch(companies, solicitation, poll_interval=0)
+
+        assert len(validator.openai_client.uploaded.splitlines()) == 2
+        assert results["Thin"]["capability_matches"][0]["capability"] == "Cloud Migration"
+        assert validator.openai_client.polls == 1
+        acme = results["Acme"]
+        assert acme["confidence"] == 0.9
+        assert acme["overall_alignment_score"] == pytest.approx(max(0.0, 0.8 - acme["hallucination_penalty"]))
+        assert results["Beta"]["content_verified"] is True
+        assert results["Beta"]["hallucination_penalty"] == 0.0
+
+
+    async def test_batch_skipped_when_no_company_qualifies(self):
+        """Test no batch job is created when every site is too thin for AI analysis"""
+        validator = WebsiteValidator()
+        validator.openai_client = FakeBatchClient(lambda request: None)
+        companies = [{"name": "Thin", "website_data": {"main_text": "", "content_validated": True}}]
+
+        results = await validator.analyze_solicitation_alignment_batch(companies, {}, poll_interval=0)
+
+        assert validator.openai_client.uploaded is None
+        assert results["Thin"]["overall_alignment_score"] == 0.5
+
+
+class TestThinContentFastPath:
+    """Test suite for skipping AI alignment on content too thin to trust"""
+
+    @pytest.mark.parametrize("website_data", [
+        {"main_text": "cloud migration", "content_validated": True, "total_content_length": 400},
+        {"main_text": "cloud migration", "content_validated": False, "total_content_length": 5000},
+    ])
+    async def test_thin_or_unvalidated_content_skips_model(self, website_data):
+        """Test the model isn't called and keyword results carry the content's verification state"""
+        validator = WebsiteValidator()
+        validator.openai_client = FakeOpenAIClient("{}")
+        solicitation = {"required_capabilities": ["Cloud Migration"]}
+
+        result = await validator._analyze_solicitation_alignment(website_data, solicitation, "Acme")
+
+        assert validator.openai_client.requests == []
+        assert result["overall_alignment_score"] == 1.0
+        assert result["hallucination_penalty"] == 0.0
+        assert result["content_verified"] is website_data["content_validated"]
+
+
+class TestFailureResults:
+    """Test suite for no-website/inaccessible/invalid-content results"""
+
+    async def test_no_website_result(self):
+        """Test companies without a website get the shared no-website result"""
+        validator = WebsiteValidator()
+        first = await validator.validate_company_website({"name": "Acme"}, {})
+        second = await validator.validate_company_website({"name": "Beta", "website": ""}, {})
+
+        assert first.website_accessible is False
+        assert first.validation_score == 0.3
+        assert first.gaps_found[0].description == "No website available for validation"
+        assert first.gaps_found is second.gaps_found
+        assert first.confirmed_capabilities == () and first.partnering_opportunities == ()
+        assert "Beta" in second.summary
+
+    def test_shared_gap_prototype_immutable(self):
+        """Test the shared no-website gap cannot be modified by one result's consumer"""
+        import dataclasses
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            website_validator._NO_WEBSITE_GAPS[0].severity = 0.0
+
+    def test_inaccessible_result_names_url(self):
+        """Test per-URL gaps are still built for inaccessible sites"""
+        result = WebsiteValidator()._create_inaccessible_website_result("Acme", "https://acme.com", {}, {})
+        assert len(result.gaps_found) == 1
+        assert "https://acme.com" in result.gaps_found[0].description
+        assert not hasattr(result, "__dict__")
+
+
+class TestSummary:
+    """Test suite for the human-readable validation summary"""
+
+    def test_summary_rendering(self):
+        """Test every section renders in order with at most three items each"""
+        critical_gaps = [
+            website_validator.WebsiteGap(website_validator.GapType.CAPABILITY_MISSING, f"Gap {i}", "", "", severity)
+            for i, severity in enumerate([0.9, 0.8, 0.7, 1.0])
+        ]
+        opportunities = [{"opportunity_type": "Teaming", "suggestion": "x" * 120}, {}]
+        alignment = {"overall_alignment_score": 0.42, "capability_matches": [{}, {}], "capability_gaps": [{}]}
+
+        summary = WebsiteValidator()._generate_summary(
+            "Acme", 0.65, ["A", "B", "C", "D"], critical_gaps, opportunities, {"pages_crawled": 4}, alignment
+        )
+
+        assert summary == (
+            "🔍 DEEP CRAWL: Analyzed 4 pages"
+            "⚠ MODERATE VALIDATION (65%)"
+            "\n📋 SOLICITATION ALIGNMENT: 42%"
+            "  ✓ 2 required capabilities confirmed on website"
+            "  ⚠ 1 required capabilities not found"
+            "\n✅ CONFIRMED CAPABILITIES (4): A, B, C + 1 more"
+            "\n\n⚠️ CRITICAL GAPS FOUND (4):\n  • Gap 0\n  • Gap 1\n  • Gap 2"
+            "\n\n🤝 PARTNERING OPPORTUNITIES (2):"
+            f"\n  • Teaming: {'x' * 100}\n  • Partnership: "
+        )
+
+    def test_summary_without_details(self):
+        """Test a bare result only reports the score band"""
+        assert WebsiteValidator()._generate_summary("Acme", 0.1, [], [], []) == "✗ WEAK VALIDATION (10%)"
+
+
+class TestValidationScore:
+    """Test suite for the overall validation score"""
+
+    @pytest.mark.parametrize("confirmed, expected", [(0, 0.3), (1, 0.65), (2, 1.0)])
+    def test_no_gaps_or_alignment(self, confirmed, expected):
+        """Test the penalty-free score is the weighted confirmation rate"""
+        company = {"capabilities": ["A", "B"]}
+        score = WebsiteValidator()._calculate_validation_score(["A", "B"][:confirmed], [], company)
+        assert score == pytest.approx(expected)
+
+    def test_gaps_and_alignment_blended(self):
+        """Test gap severity penalizes and alignment is blended in at 40%"""
+        gap = website_validator.WebsiteGap(website_validator.GapType.CAPABILITY_MISSING, "", "B", "", 1.0)
+        score = WebsiteValidator()._calculate_validation_score(
+            ["A"], [gap], {"capabilities": ["A", "B"]}, {"overall_alignment_score": 0.5}
+        )
+        assert score == pytest.approx((0.5 * 0.7 + 0.7 * 0.3) * 0.6 + 0.5 * 0.4)
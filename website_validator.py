@@ -5,13 +5,25 @@ Identifies differences and suggests partnering opportunities
 Enhanced with deep website crawling for comprehensive analysis
 """
 
+import functools
+import hashlib
+import json
 import logging
 import re
-from typing import Dict, List, Optional, Any, Tuple, Set
+import sqlite3
+import string
+import threading
+from typing import Dict, List, Optional, Any, Tuple, Set, FrozenSet, Iterable, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
-from urllib.parse import urljoin, urlparse, urlunparse
+import os
+import time
+from collections import OrderedDict, defaultdict, deque
+from itertools import islice
+from urllib.parse import urljoin, urlparse, urlsplit, urlunparse
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 try:
     import httpx
@@ -25,8 +37,207 @@ try:
 except ImportError:
     openai = None
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    np = None
+    SentenceTransformer = None
+
 logger = logging.getLogger(__name__)
 
+# Parser for model output; orjson.JSONDecodeError subclasses json.JSONDecodeError
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Website values that mean "no website" in company records
+_INVALID_URL_VALUES = frozenset({'none', 'null', 'nil', 'n/a', 'na', 'undefined', ''})
+_HTTP_PREFIXES = ('http://', 'https://')
+
+# Per-validator cache for quick validation and deep crawl results
+_CACHE_TTL = 3600  # seconds
+_CACHE_MAX_ENTRIES = 512
+
+# HTTP statuses that say "try again later" rather than anything about the site
+_TRANSIENT_STATUSES = frozenset({408, 429})
+# HEAD statuses trusted as a definite "no page here" without a GET
+_GONE_STATUSES = frozenset({404, 410})
+
+
+def _is_transient_status(status_code: int) -> bool:
+    """True for request timeouts, rate limiting and server errors"""
+    return status_code in _TRANSIENT_STATUSES or status_code >= 500
+
+# Stop reading a crawled page after this many bytes (main text is truncated far earlier)
+_MAX_PAGE_BYTES = 512_000
+# Declared bodies above this are datasheets/downloads, not pages worth parsing
+_MAX_CONTENT_LENGTH = 2_000_000
+# Linked assets that are never HTML; skipped before any request is made
+_NON_PAGE_SUFFIXES = ('.pdf', '.zip', '.png', '.jpg', '.jpeg', '.svg', '.mp4', '.gif')
+
+# Page text extraction
+_MAX_MAIN_TEXT = 5000
+_NON_CONTENT_TAGS = ['script', 'style', 'nav', 'footer', 'header', 'noscript', 'iframe', 'svg']
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Boilerplate/empty-page markers shared by quick validation and deep-crawl checks,
+# compiled to one alternation so a page is scanned once
+_BOILERPLATE_PATTERNS = (
+    "coming soon",
+    "under construction",
+    "this page is empty",
+    "no content available",
+    "page not found",
+    "404",
+    "error loading",
+)
+_BOILERPLATE_RE = re.compile("|".join(map(re.escape, _BOILERPLATE_PATTERNS)))
+
+# Capability names are compared as normalized token sets
+_CAPABILITY_STOPWORDS = frozenset({"a", "an", "and", "for", "in", "of", "on", "or", "the", "to", "with"})
+_PUNCTUATION_TO_SPACE = str.maketrans({c: " " for c in string.punctuation})
+
+
+def _stem_token(token: str) -> str:
+    """
+    Light suffix stripping so plural and -ing variants share a token
+    
+    "services" -> "service", "processes" -> "process", "engineering" ->
+    "engineer"; words whose stem would be under three letters (or ending in
+    "ss", like "access") are kept as-is.
+    """
+    if token.endswith(("sses", "ches", "shes", "xes")):
+        token = token[:-2]
+    elif token.endswith("s") and not token.endswith("ss") and len(token) > 3:
+        token = token[:-1]
+    if token.endswith("ing") and len(token) > 5:
+        token = token[:-3]
+    return token
+
+
+def _capability_tokens(text: str) -> FrozenSet[str]:
+    """Normalize a capability name to its set of lowercase, punctuation-free, stemmed non-stopword tokens"""
+    return frozenset(
+        _stem_token(token) for token in text.lower().translate(_PUNCTUATION_TO_SPACE).split()
+        if token not in _CAPABILITY_STOPWORDS
+    )
+
+
+def _bullet_list(items: List[Any]) -> str:
+    """Render items as '- item' lines for prompts"""
+    return "\n".join(f"- {item}" for item in items)
+
+
+def _tokens_match(tokens: FrozenSet[str], candidates: Set[FrozenSet[str]]) -> bool:
+    """True if tokens contain, or are contained in, any candidate token set"""
+    if not tokens:
+        return False
+    for candidate in candidates:
+        if tokens.isdisjoint(candidate):
+            continue
+        if tokens <= candidate or candidate <= tokens:
+            return True
+    return False
+
+
+# Below this much crawled text, AI alignment output can't be trusted, so it isn't requested
+_MIN_AI_CONTENT_LENGTH = 1000
+
+# Hallucination checks on AI evidence text (applied to lowercased strings)
+_EVIDENCE_REF_RE = re.compile("page|section|site|content")  # "site" also covers "website"
+_VAGUE_EVIDENCE_TERMS = frozenset({"generally", "likely", "probably", "may", "could", "appears", "seems"})
+_GENERIC_EVIDENCE_RE = re.compile(
+    "the website mentions|according to the website|the company offers|based on the content"
+)
+
+
+# Canonical capabilities and the phrases that indicate them in website text
+_CAPABILITY_KEYWORDS = {
+    "software development": ["software development", "custom software", "application development"],
+    "cloud computing": ["cloud", "aws", "azure", "gcp", "cloud computing"],
+    "cybersecurity": ["cybersecurity", "cyber security", "information security", "infosec"],
+    "data analytics": ["data analytics", "data analysis", "business intelligence", "big data"],
+    "artificial intelligence": ["artificial intelligence", "ai", "machine learning", "ml", "deep learning"],
+    "devops": ["devops", "ci/cd", "continuous integration"],
+    "mobile development": ["mobile app", "ios", "android", "mobile development"],
+    "web development": ["web development", "website", "web application"],
+    "consulting": ["consulting", "advisory", "strategic consulting"],
+    "systems integration": ["systems integration", "integration services"],
+    "it infrastructure": ["it infrastructure", "infrastructure management"],
+    "research": ["research", "r&d", "research and development"],
+    "engineering": ["engineering", "hardware engineering", "systems engineering"],
+}
+_ALL_CAPABILITY_KEYWORDS = frozenset(k for keywords in _CAPABILITY_KEYWORDS.values() for k in keywords)
+
+# Local embedding classifier over the canonical capabilities (used when there is
+# no OpenAI client and sentence-transformers is installed)
+_CAPABILITY_LABEL_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+_CAPABILITY_LABEL_THRESHOLD = 0.35
+_CAPABILITY_CHUNK_CHARS = 1000
+_CAPABILITY_MAX_CHUNKS = 20
+
+
+def _build_automaton(terms: Iterable[str]) -> Any:
+    """Build an Aho-Corasick automaton whose values are the terms themselves"""
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        # The automaton can't hold an empty word; _find_terms reports it separately
+        if term:
+            automaton.add_word(term, term)
+    if len(automaton):
+        automaton.make_automaton()
+    return automaton
+
+
+def _find_terms(text: str, terms: Set[str], automaton: Any = None) -> Set[str]:
+    """
+    Return the terms that occur as substrings of text
+    
+    Without an automaton this is one C-level substring search per distinct
+    term, which beats building an automaton for small per-call needle sets.
+    Pass a prebuilt automaton over terms for a fixed term set.
+    """
+    if automaton is None:
+        return {term for term in terms if term in text}
+    # The empty word matches any text
+    hits = {""} if "" in terms else set()
+    if len(automaton):
+        hits.update(term for _, term in automaton.iter(text))
+    return hits
+
+
+# The capability keyword set is fixed, so its automaton is built once at import
+_CAPABILITY_KEYWORD_AUTOMATON = _build_automaton(_ALL_CAPABILITY_KEYWORDS) if ahocorasick is not None else None
+
+
+# Link paths likely to describe services/capabilities, crawled first
+_PRIORITY_LINK_RE = re.compile(
+    "service|capabilit|solution|about|what-we-do|expertise|technology", re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_url(url: str) -> str:
+    """Normalize URL for cache keys (lowercase scheme/host, no default port or trailing slash)"""
+    url = url.strip()
+    if not url.lower().startswith(_HTTP_PREFIXES):
+        url = 'https://' + url
+    parsed = urlparse(url)
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+    return urlunparse((scheme, netloc, parsed.path.rstrip('/'), '', parsed.query, ''))
+
 
 class GapType(Enum):
     """Types of gaps between company profile and website"""
@@ -37,7 +248,7 @@ class GapType(Enum):
     MARKET_FOCUS_DIFFERENT = "market_focus_different"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WebsiteGap:
     """Represents a gap between claimed capabilities and website"""
     gap_type: GapType
@@ -48,21 +259,239 @@ class WebsiteGap:
     partnering_opportunity: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WebsiteValidationResult:
-    """Result of website validation"""
+    """Result of website validation (failure results share immutable empty sequences)"""
     company_name: str
     website_url: str
     website_accessible: bool
     validation_score: float  # 0.0 to 1.0 - how well website matches claims
-    gaps_found: List[WebsiteGap]
-    confirmed_capabilities: List[str]
-    website_capabilities: List[str]
-    partnering_opportunities: List[Dict[str, Any]]
+    gaps_found: Sequence[WebsiteGap]
+    confirmed_capabilities: Sequence[str]
+    website_capabilities: Sequence[str]
+    partnering_opportunities: Sequence[Dict[str, Any]]
     summary: str
     raw_website_data: Dict[str, Any] = field(default_factory=dict)
 
 
+class AlignmentCapabilityMatch(BaseModel):
+    """Required capability demonstrated on the website"""
+    model_config = ConfigDict(extra="forbid")
+    capability: str
+    evidence: str
+    confidence: float
+
+
+class AlignmentCapabilityGap(BaseModel):
+    """Required capability missing or unclear on the website"""
+    model_config = ConfigDict(extra="forbid")
+    capability: str
+    reason: str
+    severity: float
+
+
+class AlignmentProblemAreaCoverage(BaseModel):
+    """How well the website addresses one solicitation problem area"""
+    model_config = ConfigDict(extra="forbid")
+    problem_area: str
+    coverage: float = Field(description="0.0-1.0")
+
+
+class AlignmentResult(BaseModel):
+    """Structured output schema for AI solicitation alignment analysis"""
+    model_config = ConfigDict(extra="forbid")
+    overall_alignment_score: float = Field(description="0.0-1.0: how well the website shows they can meet this solicitation")
+    capability_matches: List[AlignmentCapabilityMatch]
+    capability_gaps: List[AlignmentCapabilityGap]
+    problem_area_coverage: List[AlignmentProblemAreaCoverage]
+    technical_evidence: List[str]
+    confidence: float = Field(description="0.0-1.0")
+
+
+# OpenAI structured outputs: the response is guaranteed to match AlignmentResult
+_ALIGNMENT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "alignment_result",
+        "strict": True,
+        "schema": AlignmentResult.model_json_schema(),
+    },
+}
+
+
+# Shared pieces for failure results, which are built often in batch runs and never mutated
+_EMPTY_CAPS: Tuple[str, ...] = ()
+_EMPTY_OPPORTUNITIES: Tuple[Dict[str, Any], ...] = ()
+_NO_WEBSITE_GAPS: Tuple[WebsiteGap, ...] = (
+    WebsiteGap(
+        gap_type=GapType.MARKET_FOCUS_DIFFERENT,
+        description="No website available for validation",
+        claimed_value="Website expected",
+        website_value="None",
+        severity=0.7
+    ),
+)
+
+
+# Gaps at or above this severity are reported in summaries and drive partnering suggestions
+_CRITICAL_GAP_SEVERITY = 0.7
+
+# Summary fragments shared by every validated company's summary
+_SUMMARY_BULLET = "\n  • "
+_SUMMARY_CRITICAL_GAPS = "\n\n⚠️ CRITICAL GAPS FOUND ("
+_SUMMARY_PARTNERING = "\n\n🤝 PARTNERING OPPORTUNITIES ("
+_SUMMARY_COUNT_END = "):"
+# Score bands indexed by (score >= 0.6) + (score >= 0.8); formatted with score * 100
+_SCORE_TEMPLATES = (
+    "✗ WEAK VALIDATION (%.0f%%)",
+    "⚠ MODERATE VALIDATION (%.0f%%)",
+    "✓ STRONG VALIDATION (%.0f%%)",
+)
+
+
+def _parse_page(html: str, current_url: str, base_domain: str, extract_links: bool) -> Dict[str, Any]:
+    """
+    Parse one crawled page into page data
+    
+    Extraction order matters: main text extraction strips nav/header/footer
+    before headings, sections and links are read.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    title = soup.title.string if soup.title else None
+    
+    page_data = {
+        "title": str(title) if title else "",
+        "meta_description": WebsiteValidator._extract_meta_description(soup),
+        "main_text": WebsiteValidator._extract_main_text(soup),
+        "headings": WebsiteValidator._extract_headings(soup),
+        "services": WebsiteValidator._extract_services_section(soup),
+        "about": WebsiteValidator._extract_about_section(soup),
+        "keywords": WebsiteValidator._extract_keywords(soup),
+    }
+    # Lowercased once here for the validators that scan it
+    page_data["main_text_lower"] = page_data["main_text"].lower()
+    page_data["links"] = (
+        WebsiteValidator._extract_internal_links(soup, base_domain, current_url) if extract_links else []
+    )
+    return page_data
+
+
+class _JsonEndScanner:
+    """
+    Incremental end-of-document detector for a streamed JSON reply
+    
+    Scanning only starts if the first significant character (after an
+    optional ``` fence line) is { or [; a prose reply is never cut short.
+    feed() returns the offset in the text fed so far just past the closing
+    bracket of the top-level value, or None while it is still open. Brackets
+    inside string literals (including escaped quotes) are ignored.
+    """
+    
+    __slots__ = ("text", "pos", "active", "depth", "in_string", "escaped")
+    
+    def __init__(self) -> None:
+        self.text = ""
+        self.pos = 0
+        self.active: Optional[bool] = None
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, chunk: str) -> Optional[int]:
+        self.text += chunk
+        if self.active is None:
+            head = self.text.lstrip()
+            if head.startswith("```"):
+                newline = head.find("\n")
+                if newline == -1:
+                    return None
+                head = head[newline + 1:].lstrip()
+            elif "```".startswith(head):
+                return None  # nothing significant yet, or a fence still arriving
+            if not head:
+                return None
+            self.active = head[0] in "{["
+            self.pos = len(self.text) - len(head)
+        if not self.active:
+            return None
+        
+        text = self.text
+        for i in range(self.pos, len(text)):
+            char = text[i]
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in "{[":
+                self.depth += 1
+            elif char in "}]":
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        self.pos = len(text)
+        return None
+
+
+class AIResponseCache:
+    """
+    SQLite-backed cache of AI completions, persisted across runs
+    
+    Keys are request hashes (model, messages, temperature, limits), so a
+    rerun over byte-identical website content and solicitation text reuses
+    the stored response instead of paying for another call.
+    
+    Methods block on disk I/O; async callers run them in a worker thread.
+    Expired rows are pruned on open and on every write.
+    """
+    
+    def __init__(self, path: str, ttl: float = 7 * 24 * 3600):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ai_responses "
+            "(key TEXT PRIMARY KEY, stored_at REAL, content TEXT, usage TEXT)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ai_responses_stored_at ON ai_responses (stored_at)"
+        )
+        self._prune()
+        self._conn.commit()
+    
+    def _prune(self) -> None:
+        """Delete rows older than the TTL (caller commits)"""
+        self._conn.execute("DELETE FROM ai_responses WHERE stored_at < ?", (time.time() - self.ttl,))
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return cached content if present and within TTL, else None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, content FROM ai_responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[0] > self.ttl:
+            return None
+        return row[1]
+    
+    def put(self, key: str, content: str, usage: Optional[Dict[str, Any]] = None) -> None:
+        """Store a response (and its token usage, for cost accounting)"""
+        with self._lock:
+            self._prune()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ai_responses VALUES (?, ?, ?, ?)",
+                (key, time.time(), content, json.dumps(usage) if usage else None)
+            )
+            self._conn.commit()
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
 class WebsiteValidator:
     """
     Website Validator - Tests companies against their websites
@@ -76,7 +505,17 @@ class WebsiteValidator:
     6. Suggests partnering opportunities based on gaps
     """
     
-    def __init__(self, openai_api_key: Optional[str] = None, max_pages: int = 10, max_depth: int = 3):
+    def __init__(
+        self,
+        openai_api_key: Optional[str] = None,
+        max_pages: int = 10,
+        max_depth: int = 3,
+        max_per_host: int = 5,
+        max_per_second: float = 10.0,
+        max_ai_concurrency: int = 8,
+        ai_cache_path: Optional[str] = None,
+        ai_cache_ttl: float = 7 * 24 * 3600
+    ):
         """
         Initialize website validator with optional AI enhancement
         
@@ -84,17 +523,190 @@ class WebsiteValidator:
             openai_api_key: OpenAI API key for AI-powered analysis
             max_pages: Maximum number of pages to crawl (default: 10)
             max_depth: Maximum crawl depth from homepage (default: 3)
+            max_per_host: Maximum concurrent requests to one host (default: 5)
+            max_per_second: Maximum request rate to one host (default: 10)
+            max_ai_concurrency: Maximum in-flight OpenAI requests (default: 8)
+            ai_cache_path: SQLite file for persistent AI response caching
+                (default: AI_CACHE_PATH env var; disabled if unset)
+            ai_cache_ttl: Seconds a persisted AI response stays valid (default: 7 days)
         """
         self.openai_client = None
         if openai_api_key and openai:
             try:
-                self.openai_client = openai.OpenAI(api_key=openai_api_key)
+                self.openai_client = openai.AsyncOpenAI(api_key=openai_api_key)
                 logger.info("✓ OpenAI initialized for website validation")
             except Exception as e:
                 logger.warning(f"Could not initialize OpenAI: {e}")
         
         self.max_pages = max_pages
         self.max_depth = max_depth
+        self.max_per_host = max_per_host
+        self.max_per_second = max_per_second
+        
+        # Politeness limits shared by every crawl this validator runs, keyed by host
+        self._per_host_sem: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.max_per_host)
+        )
+        self._host_next_slot: Dict[str, float] = {}
+        
+        # Results keyed by normalized URL: (stored_at, value), oldest first
+        self._quick_cache: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+        self._crawl_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        
+        # Bounds concurrent OpenAI calls across every validation sharing this validator
+        self._ai_sem = asyncio.Semaphore(max_ai_concurrency)
+        
+        # Deterministic (temperature=0) AI responses keyed by request hash
+        self._completion_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._partnering_cache: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        
+        # Optional persistent cache so reruns over identical inputs skip the API
+        self._ai_disk_cache: Optional[AIResponseCache] = None
+        ai_cache_path = ai_cache_path or os.getenv("AI_CACHE_PATH")
+        if ai_cache_path:
+            try:
+                self._ai_disk_cache = AIResponseCache(ai_cache_path, ttl=ai_cache_ttl)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not open AI response cache at {ai_cache_path}: {e}")
+        
+        # Shared HTTP client (created on first request) so DNS/TCP/TLS setup is
+        # reused across quick validations and crawls of the same host
+        self._client: Optional[Any] = None
+        
+        # Embedding model and canonical-capability embeddings (loaded on first use)
+        self._label_model: Optional[Any] = None
+        self._label_embeddings: Optional[Any] = None
+        # Loading runs in worker threads; concurrent companies must not each load the model
+        self._label_model_lock = threading.Lock()
+        self._local_classifier_available = SentenceTransformer is not None
+    
+    async def _chat_completion(self, force_refresh: bool = False, stream_json: bool = False, **request: Any) -> str:
+        """
+        Run an OpenAI chat completion and return the stripped message text
+        
+        Requests with temperature=0 are cached in memory by a hash of the full
+        request, so identical website content is only sent to the model once.
+        When a disk cache is configured every request is also persisted there.
+        force_refresh skips both cache lookups (the fresh response is stored).
+        stream_json streams the response and stops reading as soon as the
+        top-level JSON value closes (see _stream_json_completion).
+        """
+        cache_key = hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+        in_memory = request.get("temperature") == 0
+        if not force_refresh:
+            cached = self._cache_get(self._completion_cache, cache_key) if in_memory else None
+            if cached is None and self._ai_disk_cache is not None:
+                cached = await asyncio.to_thread(self._ai_disk_cache.get, cache_key)
+            if cached is not None:
+                logger.debug(f"AI completion cache hit ({request.get('model')})")
+                return cached
+        
+        async with self._ai_sem:
+            if stream_json:
+                content, usage = await self._stream_json_completion(request)
+            else:
+                response = await self.openai_client.chat.completions.create(**request)
+                content = response.choices[0].message.content.strip()
+                usage = getattr(response, "usage", None)
+        
+        # Prompts put static instructions and shared context first so OpenAI's
+        # automatic prefix caching applies; log the hit rate to keep it honest
+        if usage is not None:
+            details = getattr(usage, "prompt_tokens_details", None)
+            cached_tokens = getattr(details, "cached_tokens", None) or 0
+            logger.debug(
+                f"AI completion ({request.get('model')}): {usage.prompt_tokens} prompt tokens, {cached_tokens} cached"
+            )
+        
+        if in_memory:
+            self._cache_put(self._completion_cache, cache_key, content)
+        if self._ai_disk_cache is not None:
+            await asyncio.to_thread(
+                self._ai_disk_cache.put, cache_key, content,
+                {"prompt_tokens": usage.prompt_tokens, "completion_tokens": usage.completion_tokens} if usage is not None else None
+            )
+        return content
+    
+    async def _stream_json_completion(self, request: Dict[str, Any]) -> Tuple[str, Any]:
+        """
+        Stream a completion whose answer is expected to be a JSON value
+        
+        Closes the stream once the top-level object/array is balanced, so a
+        response that would otherwise run on (trailing whitespace or prose up
+        to max_tokens) returns as soon as the JSON ends. Replies that do not
+        open with JSON are read in full. Usage is only reported in the final
+        chunk, so it is None after an early exit.
+        """
+        stream = await self.openai_client.chat.completions.create(
+            **request, stream=True, stream_options={"include_usage": True}
+        )
+        scanner = _JsonEndScanner()
+        usage = None
+        end = None
+        try:
+            async for chunk in stream:
+                usage = getattr(chunk, "usage", None) or usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                end = scanner.feed(delta)
+                if end is not None:
+                    break
+        finally:
+            await stream.close()
+        return scanner.text[:end].strip(), usage
+    
+    async def _wait_for_host_slot(self, host: str) -> None:
+        """Space requests to one host at least 1/max_per_second apart"""
+        if self.max_per_second <= 0:
+            return
+        now = time.monotonic()
+        slot = max(now, self._host_next_slot.get(host, now))
+        self._host_next_slot[host] = slot + 1.0 / self.max_per_second
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    def _get_client(self) -> Any:
+        """Return the shared httpx.AsyncClient, creating it on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                # Fail fast on hung connects (e.g. an unreachable IPv6 route). No custom
+                # transport, so HTTP(S)_PROXY / NO_PROXY from the environment still apply
+                timeout=httpx.Timeout(20.0, connect=3.0),
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Release the HTTP client and AI response cache connection held by this validator"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._ai_disk_cache is not None:
+            self._ai_disk_cache.close()
+            self._ai_disk_cache = None
+    
+    def _cache_get(self, cache: "OrderedDict[str, Tuple[float, Any]]", key: str) -> Optional[Any]:
+        """Return cached value if present and within TTL, else None"""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > _CACHE_TTL:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return value
+    
+    def _cache_put(self, cache: "OrderedDict[str, Tuple[float, Any]]", key: str, value: Any) -> None:
+        """Store value in cache, evicting least recently used entries over the cap"""
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > _CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
     
     async def quick_validate_website_url(self, url: str) -> bool:
         """
@@ -111,8 +723,7 @@ class WebsiteValidator:
         
         # Check for invalid string values (None, null, N/A, etc. as strings)
         url_str = str(url).strip()
-        invalid_values = ['none', 'null', 'nil', 'n/a', 'na', 'undefined', '']
-        if url_str.lower() in invalid_values:
+        if url_str.lower() in _INVALID_URL_VALUES:
             logger.debug(f"Quick validation failed: Invalid string value '{url_str}'")
             return False
         
@@ -123,12 +734,13 @@ class WebsiteValidator:
         
         # Check if URL looks like a valid domain before normalizing
         url_for_check = url_str.lower()
-        if url_for_check.startswith(('http://', 'https://')):
-            url_for_check = url_for_check.split('://', 1)[1]
-        url_for_check = url_for_check.split('/')[0].split('?')[0].split('#')[0]
+        try:
+            host = urlsplit(url_for_check if '://' in url_for_check else 'https://' + url_for_check).hostname or ''
+        except ValueError:
+            host = ''
         
         # Must have at least one dot and valid TLD
-        if '.' not in url_for_check or len(url_for_check.split('.')[-1]) < 2:
+        if '.' not in host or len(host.rsplit('.', 1)[-1]) < 2:
             logger.debug(f"Quick validation failed: Doesn't look like valid domain '{url_str}'")
             return False
         
@@ -136,56 +748,97 @@ class WebsiteValidator:
             logger.warning("httpx or BeautifulSoup not available for quick validation")
             return False
         
+        # Normalize URL (only after validation)
+        if not url_str.startswith(_HTTP_PREFIXES):
+            url = 'https://' + url_str
+        else:
+            url = url_str
+        
+        cache_key = _normalize_url(url)
+        cached = self._cache_get(self._quick_cache, cache_key)
+        if cached is not None:
+            logger.debug(f"Quick validation cache hit for {url}: {cached}")
+            return cached
+        
+        is_valid = await self._quick_validate_fetch(url)
+        if is_valid is None:
+            # Timeout or transport error - report invalid now but retry on the next call
+            return False
+        self._cache_put(self._quick_cache, cache_key, is_valid)
+        return is_valid
+    
+    async def _quick_validate_fetch(self, url: str) -> Optional[bool]:
+        """
+        Fetch first page and check it for meaningful content (uncached)
+        
+        Returns None when no definite answer was reached (timeouts, transport
+        or parse errors, 408/429/5xx responses) so the caller does not cache
+        a transient failure.
+        """
         try:
-            # Normalize URL (only after validation)
-            if not url_str.startswith(('http://', 'https://')):
-                url = 'https://' + url_str
-            else:
-                url = url_str
+            # Quick timeout for first page only; shared client reuses pooled connections
+            client = self._get_client()
+            timeout = httpx.Timeout(10.0, connect=3.0)
+            
+            # Cheap HEAD probe first so dead or non-HTML URLs never download a body
+            head = await client.head(url, timeout=httpx.Timeout(5.0, connect=3.0))
+            
+            if head.status_code in _GONE_STATUSES:
+                logger.debug(f"Quick validation failed: HTTP {head.status_code} (HEAD) for {url}")
+                return False
             
-            # Quick timeout for first page only
-            async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-                response = await client.get(url)
+            if 200 <= head.status_code < 300:
+                content_type = head.headers.get('content-type', '').lower()
+                if content_type and 'html' not in content_type:
+                    logger.debug(f"Quick validation failed: Non-HTML content type '{content_type}' for {url}")
+                    return False
                 
+                response = await client.get(url, timeout=timeout)
                 if response.status_code != 200:
                     logger.debug(f"Quick validation failed: HTTP {response.status_code} for {url}")
-                    return False
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extract basic content
-                title = soup.title.string if soup.title else ""
-                main_text = self._extract_main_text(soup)
-                headings = self._extract_headings(soup)
-                
-                # Check minimum content requirements (lighter than full validation)
-                MIN_TEXT_LENGTH = 100  # At least 100 chars
-                MIN_HEADINGS = 1  # At least 1 heading
-                
-                if len(main_text) < MIN_TEXT_LENGTH:
-                    logger.debug(f"Quick validation failed: Insufficient text ({len(main_text)} < {MIN_TEXT_LENGTH}) for {url}")
-                    return False
-                
-                if len(headings) < MIN_HEADINGS:
-                    logger.debug(f"Quick validation failed: No headings found for {url}")
-                    return False
-                
-                # Check for boilerplate
-                text_lower = main_text.lower()
-                boilerplate_patterns = ["coming soon", "under construction", "page not found", "404", "error loading"]
-                if any(pattern in text_lower for pattern in boilerplate_patterns):
-                    logger.debug(f"Quick validation failed: Boilerplate content detected for {url}")
-                    return False
-                
-                logger.info(f"✓ Quick validation passed for {url}")
-                return True
-                
+                    return None if _is_transient_status(response.status_code) else False
+            else:
+                # HEAD refused or unsupported (405/501, WAF/CDN 403s, ...) - let
+                # the start of the page decide instead
+                response = await client.get(url, headers={'Range': 'bytes=0-8192'}, timeout=timeout)
+                if response.status_code not in (200, 206):
+                    logger.debug(f"Quick validation failed: HTTP {response.status_code} for {url}")
+                    return None if _is_transient_status(response.status_code) else False
+            
+            soup = BeautifulSoup(response.text, 'html.parser')
+            
+            # Extract basic content
+            title = soup.title.string if soup.title else ""
+            main_text = self._extract_main_text(soup)
+            headings = self._extract_headings(soup)
+            
+            # Check minimum content requirements (lighter than full validation)
+            MIN_TEXT_LENGTH = 100  # At least 100 chars
+            MIN_HEADINGS = 1  # At least 1 heading
+            
+            if len(main_text) < MIN_TEXT_LENGTH:
+                logger.debug(f"Quick validation failed: Insufficient text ({len(main_text)} < {MIN_TEXT_LENGTH}) for {url}")
+                return False
+            
+            if len(headings) < MIN_HEADINGS:
+                logger.debug(f"Quick validation failed: No headings found for {url}")
+                return False
+            
+            # Check for boilerplate
+            text_lower = main_text.lower()
+            if _BOILERPLATE_RE.search(text_lower):
+                logger.debug(f"Quick validation failed: Boilerplate content detected for {url}")
+                return False
+            
+            logger.info(f"✓ Quick validation passed for {url}")
+            return True
+            
         except httpx.TimeoutException:
             logger.debug(f"Quick validation timeout for {url}")
-            return False
+            return None
         except Exception as e:
             logger.debug(f"Quick validation error for {url}: {e}")
-            return False
+            return None
     
     async def validate_company_website(
         self,
@@ -229,33 +882,40 @@ class WebsiteValidator:
                 company_name, website_url, company_data, solicitation_data
             )
         
-        # Extract capabilities from all crawled pages
-        website_capabilities = await self._extract_website_capabilities(
-            crawled_data, company_name
-        )
+        # Lowercased text of every crawled field, shared by the keyword/gap/hallucination checks
+        self._joined_website_text(crawled_data)
         
-        # Analyze against solicitation requirements
-        solicitation_alignment = await self._analyze_solicitation_alignment(
-            crawled_data, solicitation_data, company_name
+        # Extract capabilities and analyze against solicitation requirements;
+        # the two AI calls are independent, so run them concurrently
+        website_capabilities, solicitation_alignment = await asyncio.gather(
+            self._extract_website_capabilities(crawled_data, company_name),
+            self._analyze_solicitation_alignment(crawled_data, solicitation_data, company_name)
         )
         
+        capability_tokens = self._tokenize_capabilities(website_capabilities)
+        
         # Compare claimed vs website capabilities (using all crawled data)
         gaps = await self._identify_gaps(
             company_data, 
             website_capabilities,
             solicitation_data,
-            crawled_data
+            crawled_data,
+            capability_tokens
         )
         
+        # Filtered once here for both the partnering suggestions and the summary
+        critical_gaps = [gap for gap in gaps if gap.severity >= _CRITICAL_GAP_SEVERITY]
+        
         # Identify confirmed capabilities
         confirmed_capabilities = self._identify_confirmed_capabilities(
             company_data,
-            website_capabilities
+            website_capabilities,
+            capability_tokens
         )
         
         # Generate partnering opportunities based on gaps
         partnering_opportunities = await self._generate_partnering_opportunities(
-            gaps,
+            critical_gaps,
             company_data,
             solicitation_data,
             website_capabilities
@@ -274,7 +934,7 @@ class WebsiteValidator:
             company_name,
             validation_score,
             confirmed_capabilities,
-            gaps,
+            critical_gaps,
             partnering_opportunities,
             crawled_data,
             solicitation_alignment
@@ -293,6 +953,7 @@ class WebsiteValidator:
             raw_website_data={
                 **crawled_data,
                 "solicitation_alignment": solicitation_alignment,
+                "capability_tokens": capability_tokens,
                 "pages_crawled": len(crawled_data.get("pages", []))
             }
         )
@@ -308,77 +969,75 @@ class WebsiteValidator:
             logger.warning("httpx or BeautifulSoup not available")
             return {"accessible": False, "error": "Dependencies not installed"}
         
+        cache_key = _normalize_url(start_url)
+        cached = self._cache_get(self._crawl_cache, cache_key)
+        if cached is not None:
+            logger.info(f"Deep crawl cache hit for {start_url}")
+            return cached
+        
         try:
             # Normalize URL
-            if not start_url.startswith(('http://', 'https://')):
+            if not start_url.startswith(_HTTP_PREFIXES):
                 start_url = 'https://' + start_url
             
             parsed_start = urlparse(start_url)
             base_domain = f"{parsed_start.scheme}://{parsed_start.netloc}"
             
-            visited_urls: Set[str] = set()
             pages_data: List[Dict[str, Any]] = []
-            urls_to_visit: List[Tuple[str, int]] = [(start_url, 0)]  # (url, depth)
+            urls_to_visit: "deque[Tuple[str, int]]" = deque([(start_url, 0)])  # (url, depth)
+            # Every URL ever enqueued (including the start page's cleaned form, as links
+            # to it appear), so each page is queued at most once
+            queued: Set[str] = {start_url, f"{base_domain}{parsed_start.path or '/'}"}
             
-            async with httpx.AsyncClient(timeout=20.0, follow_redirects=True) as client:
-                while urls_to_visit and len(pages_data) < self.max_pages:
-                    current_url, depth = urls_to_visit.pop(0)
+            client = self._get_client()
+            while urls_to_visit and len(pages_data) < self.max_pages:
+                current_url, depth = urls_to_visit.popleft()
+                
+                # Skip if too deep
+                if depth > self.max_depth:
+                    continue
+                
+                # Only crawl same domain
+                parsed_current = urlparse(current_url)
+                if parsed_current.netloc != parsed_start.netloc:
+                    continue
+                
+                try:
+                    logger.info(f"Crawling page {len(pages_data) + 1}/{self.max_pages}: {current_url} (depth {depth})")
+                    async with self._per_host_sem[parsed_current.netloc]:
+                        await self._wait_for_host_slot(parsed_current.netloc)
+                        page = await self._fetch_page(client, current_url)
                     
-                    # Skip if already visited or too deep
-                    if current_url in visited_urls or depth > self.max_depth:
+                    if page is None:
                         continue
                     
-                    # Only crawl same domain
-                    parsed_current = urlparse(current_url)
-                    if parsed_current.netloc != parsed_start.netloc:
-                        continue
+                    final_url, html = page
                     
-                    try:
-                        logger.info(f"Crawling page {len(pages_data) + 1}/{self.max_pages}: {current_url} (depth {depth})")
-                        response = await client.get(current_url, timeout=15.0)
-                        
-                        if response.status_code != 200:
-                            continue
-                        
-                        visited_urls.add(current_url)
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        # Extract page data
-                        page_data = {
-                            "url": str(response.url),
-                            "title": soup.title.string if soup.title else "",
-                            "meta_description": self._extract_meta_description(soup),
-                            "main_text": self._extract_main_text(soup),
-                            "headings": self._extract_headings(soup),
-                            "services": self._extract_services_section(soup),
-                            "about": self._extract_about_section(soup),
-                            "keywords": self._extract_keywords(soup),
-                            "depth": depth
-                        }
-                        
-                        # Quick validation: Skip pages with no meaningful content
-                        if len(page_data["main_text"]) < 50 and len(page_data["headings"]) == 0:
-                            logger.debug(f"Skipping page with insufficient content: {current_url}")
-                            continue
-                        
-                        pages_data.append(page_data)
-                        
-                        # Extract links for further crawling (if not at max depth)
-                        if depth < self.max_depth:
-                            links = self._extract_internal_links(soup, base_domain, current_url)
-                            for link in links:
-                                if link not in visited_urls:
-                                    urls_to_visit.append((link, depth + 1))
-                        
-                    except httpx.TimeoutException:
-                        logger.warning(f"Timeout crawling: {current_url}")
-                        continue
-                    except Exception as e:
-                        logger.warning(f"Error crawling {current_url}: {e}")
+                    # Extract page data (and links, if not at max depth)
+                    page_data = _parse_page(html, current_url, base_domain, depth < self.max_depth)
+                    links = page_data.pop("links")
+                    page_data["url"] = final_url
+                    page_data["depth"] = depth
+                    
+                    # Quick validation: Skip pages with no meaningful content
+                    if len(page_data["main_text"]) < 50 and len(page_data["headings"]) == 0:
+                        logger.debug(f"Skipping page with insufficient content: {current_url}")
                         continue
                     
-                    # Small delay to be respectful
-                    await asyncio.sleep(0.5)
+                    pages_data.append(page_data)
+                    
+                    # Queue links for further crawling
+                    for link in links:
+                        if link not in queued:
+                            queued.add(link)
+                            urls_to_visit.append((link, depth + 1))
+                    
+                except httpx.TimeoutException:
+                    logger.warning(f"Timeout crawling: {current_url}")
+                    continue
+                except Exception as e:
+                    logger.warning(f"Error crawling {current_url}: {e}")
+                    continue
             
             if not pages_data:
                 return {"accessible": False, "error": "No pages could be crawled"}
@@ -394,19 +1053,60 @@ class WebsiteValidator:
                 logger.warning(f"⚠ Website content validation failed for {start_url} - insufficient meaningful content")
                 aggregated_data["accessible"] = False
                 aggregated_data["error"] = "Insufficient meaningful content found"
+                self._cache_put(self._crawl_cache, cache_key, aggregated_data)
                 return aggregated_data
             
             logger.info(f"✓ Successfully crawled {len(pages_data)} pages from {start_url} (content validated)")
             
+            self._cache_put(self._crawl_cache, cache_key, aggregated_data)
             return aggregated_data
                 
         except Exception as e:
             logger.error(f"Deep crawl error for {start_url}: {e}")
             return {"accessible": False, "error": str(e)}
     
-    def _extract_internal_links(self, soup: Any, base_domain: str, current_url: str) -> List[str]:
+    async def _fetch_page(self, client: Any, url: str) -> Optional[Tuple[str, str]]:
+        """
+        Stream a page body, stopping after _MAX_PAGE_BYTES
+        
+        Returns:
+            (final_url, html) tuple, or None for non-200, non-HTML or oversized responses
+        """
+        async with client.stream('GET', url, timeout=httpx.Timeout(15.0, connect=3.0)) as response:
+            if response.status_code != 200:
+                return None
+            
+            content_type = response.headers.get('content-type', '').lower()
+            if content_type and 'html' not in content_type:
+                logger.debug(f"Skipping non-HTML page ({content_type}): {url}")
+                return None
+            
+            try:
+                content_length = int(response.headers.get('content-length') or 0)
+            except ValueError:
+                content_length = 0
+            if content_length > _MAX_CONTENT_LENGTH:
+                logger.debug(f"Skipping oversized page ({content_length} bytes): {url}")
+                return None
+            
+            chunks = []
+            total = 0
+            async for chunk in response.aiter_bytes(65536):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= _MAX_PAGE_BYTES:
+                    logger.debug(f"Page body truncated at {total} bytes: {url}")
+                    break
+            
+            html = b''.join(chunks).decode(response.encoding or 'utf-8', errors='ignore')
+            return str(response.url), html
+    
+    @staticmethod
+    def _extract_internal_links(soup: Any, base_domain: str, current_url: str) -> List[str]:
         """Extract internal links from page for further crawling"""
         links = []
+        seen = set()
+        base_netloc = urlparse(base_domain).netloc
         try:
             for anchor in soup.find_all('a', href=True):
                 href = anchor['href']
@@ -419,17 +1119,24 @@ class WebsiteValidator:
                 absolute_url = urljoin(current_url, href)
                 parsed = urlparse(absolute_url)
                 
-                # Only include same-domain links
-                if parsed.netloc == urlparse(base_domain).netloc:
+                # Only include same-domain links, skipping downloadable assets
+                if parsed.netloc == base_netloc:
+                    if parsed.path.lower().endswith(_NON_PAGE_SUFFIXES):
+                        continue
                     # Remove fragments and query params for deduplication
                     clean_url = urlunparse((parsed.scheme, parsed.netloc, parsed.path, '', '', ''))
-                    if clean_url not in links:
+                    if clean_url not in seen:
+                        seen.add(clean_url)
                         links.append(clean_url)
             
             # Prioritize important pages (services, about, capabilities, solutions)
-            priority_keywords = ['service', 'capabilit', 'solution', 'about', 'what-we-do', 'expertise', 'technology']
-            priority_links = [l for l in links if any(kw in l.lower() for kw in priority_keywords)]
-            other_links = [l for l in links if l not in priority_links]
+            priority_links = []
+            other_links = []
+            for link in links:
+                if _PRIORITY_LINK_RE.search(link):
+                    priority_links.append(link)
+                else:
+                    other_links.append(link)
             
             # Return priority links first, then others
             return priority_links[:5] + other_links[:10]  # Limit to prevent too many links
@@ -450,6 +1157,8 @@ class WebsiteValidator:
         MIN_TOTAL_CONTENT = 500  # At least 500 chars total
         MIN_HEADINGS = 2  # At least 2 headings
         MIN_PAGES = 1  # At least 1 page successfully crawled
+        MAX_BOILERPLATE_SCAN_LENGTH = 2000  # Longer text is never mostly boilerplate
+        DIVERSITY_SAMPLE_WORDS = 2000  # Words sampled for the diversity ratio
         
         main_text = aggregated_data.get("main_text", "")
         total_length = aggregated_data.get("total_content_length", 0)
@@ -474,27 +1183,20 @@ class WebsiteValidator:
             return False
         
         # Check for boilerplate/empty content patterns
-        text_lower = main_text.lower()
-        
-        # Common boilerplate patterns that indicate empty/minimal content
-        boilerplate_patterns = [
-            "coming soon",
-            "under construction",
-            "this page is empty",
-            "no content available",
-            "page not found",
-            "404",
-            "error loading"
-        ]
-        
-        # If content is mostly boilerplate, reject it
-        boilerplate_ratio = sum(1 for pattern in boilerplate_patterns if pattern in text_lower) / len(boilerplate_patterns)
-        if boilerplate_ratio > 0.3:  # More than 30% boilerplate
-            logger.warning(f"Content validation failed: Too much boilerplate content detected")
-            return False
+        text_lower = aggregated_data.get("main_text_lower") or main_text.lower()
+        
+        # If content is mostly boilerplate, reject it (distinct patterns found in one pass).
+        # Substantial text can't be mostly boilerplate, so only short pages are scanned.
+        if len(main_text) <= MAX_BOILERPLATE_SCAN_LENGTH:
+            boilerplate_hits = set(_BOILERPLATE_RE.findall(text_lower))
+            boilerplate_ratio = len(boilerplate_hits) / len(_BOILERPLATE_PATTERNS)
+            if boilerplate_ratio > 0.3:  # More than 30% boilerplate
+                logger.warning(f"Content validation failed: Too much boilerplate content detected")
+                return False
         
-        # Check for meaningful word diversity (not just repeated words)
-        words = text_lower.split()
+        # Check for meaningful word diversity (not just repeated words) over the
+        # first DIVERSITY_SAMPLE_WORDS words
+        words = text_lower.split(maxsplit=DIVERSITY_SAMPLE_WORDS)[:DIVERSITY_SAMPLE_WORDS]
         unique_words = set(words)
         if len(words) > 0:
             diversity_ratio = len(unique_words) / len(words)
@@ -545,6 +1247,9 @@ class WebsiteValidator:
             "title": all_titles[0] if all_titles else "",
             "meta_description": " ".join(all_descriptions[:3]),  # Combine top descriptions
             "main_text": all_main_text[:20000],  # Limit total text to 20k chars
+            "main_text_lower": " ".join(
+                [p.get("main_text_lower") or p.get("main_text", "").lower() for p in pages_data]
+            )[:20000],
             "headings": unique_headings[:50],  # Top 50 unique headings
             "services": all_services[:5000],  # Combined services text
             "about": all_about[:5000],  # Combined about text
@@ -572,7 +1277,8 @@ class WebsiteValidator:
             }
         return result
     
-    def _extract_meta_description(self, soup: Any) -> str:
+    @staticmethod
+    def _extract_meta_description(soup: Any) -> str:
         """Extract meta description from HTML"""
         try:
             meta = soup.find('meta', attrs={'name': 'description'})
@@ -585,25 +1291,32 @@ class WebsiteValidator:
             pass
         return ""
     
-    def _extract_main_text(self, soup: Any) -> str:
-        """Extract main body text from HTML"""
+    @staticmethod
+    def _extract_main_text(soup: Any) -> str:
+        """Extract main body text from HTML (first _MAX_MAIN_TEXT chars)"""
         try:
-            # Remove script and style elements
-            for script in soup(['script', 'style', 'nav', 'footer', 'header']):
-                script.decompose()
-            
-            # Get text
-            text = soup.get_text(separator=' ', strip=True)
+            # Remove non-content elements in one pass; extract() just detaches,
+            # unlike decompose() which also walks and tears down each subtree
+            for element in soup.find_all(_NON_CONTENT_TAGS):
+                element.extract()
             
-            # Clean up whitespace
-            text = re.sub(r'\s+', ' ', text)
+            # Collect stripped strings (as get_text(' ', strip=True) would) with
+            # whitespace collapsed, stopping once past the length limit
+            parts = []
+            length = 0
+            for piece in soup.stripped_strings:
+                piece = _WHITESPACE_RE.sub(' ', piece)
+                parts.append(piece)
+                length += len(piece) + 1
+                if length > _MAX_MAIN_TEXT:
+                    break
             
-            # Limit to first 5000 characters
-            return text[:5000]
+            return ' '.join(parts)[:_MAX_MAIN_TEXT]
         except:
             return ""
     
-    def _extract_headings(self, soup: Any) -> List[str]:
+    @staticmethod
+    def _extract_headings(soup: Any) -> List[str]:
         """Extract all headings from HTML"""
         try:
             headings = []
@@ -616,7 +1329,8 @@ class WebsiteValidator:
         except:
             return []
     
-    def _extract_services_section(self, soup: Any) -> str:
+    @staticmethod
+    def _extract_services_section(soup: Any) -> str:
         """Try to find and extract services/capabilities section"""
         try:
             # Look for common services section markers
@@ -637,7 +1351,8 @@ class WebsiteValidator:
         except:
             return ""
     
-    def _extract_about_section(self, soup: Any) -> str:
+    @staticmethod
+    def _extract_about_section(soup: Any) -> str:
         """Try to find and extract about section"""
         try:
             about_keywords = ['about us', 'about', 'who we are', 'our company', 'our story']
@@ -655,7 +1370,8 @@ class WebsiteValidator:
         except:
             return ""
     
-    def _extract_keywords(self, soup: Any) -> List[str]:
+    @staticmethod
+    def _extract_keywords(soup: Any) -> List[str]:
         """Extract keywords from meta tags"""
         try:
             meta = soup.find('meta', attrs={'name': 'keywords'})
@@ -671,18 +1387,23 @@ class WebsiteValidator:
         website_data: Dict[str, Any],
         company_name: str
     ) -> List[str]:
-        """Extract capabilities from all crawled website pages using AI analysis"""
+        """Extract capabilities from all crawled website pages using keyword, AI or local-model analysis"""
         
         # First, try keyword-based extraction from all pages
         keyword_capabilities = self._extract_capabilities_by_keywords(website_data)
         
-        # If OpenAI is available, use AI to extract more sophisticated capabilities from all content
+        # Use AI to extract capabilities from all content; without an OpenAI
+        # client, fall back to the local classifier if it is installed
+        ai_capabilities = None
         if self.openai_client:
             ai_capabilities = await self._extract_capabilities_with_ai(
                 website_data,
                 company_name
             )
-            
+        elif self._local_classifier_available:
+            ai_capabilities = await self._classify_capabilities_locally(website_data)
+        
+        if ai_capabilities is not None:
             # Combine and deduplicate
             all_capabilities = keyword_capabilities + ai_capabilities
             # Deduplicate (case-insensitive)
@@ -698,6 +1419,49 @@ class WebsiteValidator:
         
         return keyword_capabilities
     
+    async def _classify_capabilities_locally(self, website_data: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Label website content with canonical capabilities using sentence embeddings
+        
+        Returns None if the embedding model can't be loaded, so callers can
+        fall back to keyword extraction alone.
+        """
+        text = self._joined_website_text(website_data)
+        chunks = [
+            text[i:i + _CAPABILITY_CHUNK_CHARS]
+            for i in range(0, min(len(text), _CAPABILITY_CHUNK_CHARS * _CAPABILITY_MAX_CHUNKS), _CAPABILITY_CHUNK_CHARS)
+        ]
+        if not chunks:
+            return []
+        try:
+            # Encoding is CPU-bound; keep it off the event loop
+            return await asyncio.to_thread(self._score_capability_labels, chunks)
+        except Exception as e:
+            logger.warning(f"Local capability classifier unavailable, using keyword extraction: {e}")
+            self._local_classifier_available = False
+            return None
+    
+    def _score_capability_labels(self, chunks: List[str]) -> List[str]:
+        """Return canonical capabilities whose embedding is close to any text chunk"""
+        if self._label_model is None:
+            with self._label_model_lock:
+                if self._label_model is None:
+                    model = SentenceTransformer(_CAPABILITY_LABEL_MODEL)
+                    self._label_embeddings = np.asarray(model.encode(
+                        list(_CAPABILITY_KEYWORDS), normalize_embeddings=True
+                    ))
+                    self._label_model = model
+        chunk_embeddings = np.asarray(self._label_model.encode(chunks, normalize_embeddings=True))
+        
+        # Embeddings are unit length, so the dot products are cosine similarities;
+        # best score per label over all chunks
+        best = (chunk_embeddings @ self._label_embeddings.T).max(axis=0)
+        return [
+            label.title()
+            for label, score in zip(_CAPABILITY_KEYWORDS, best)
+            if score >= _CAPABILITY_LABEL_THRESHOLD
+        ]
+    
     async def _analyze_solicitation_alignment(
         self,
         website_data: Dict[str, Any],
@@ -713,128 +1477,261 @@ class WebsiteValidator:
         - Problem areas
         - Key priorities
         """
-        alignment_result = {
-            "overall_alignment_score": 0.0,
-            "capability_matches": [],
-            "capability_gaps": [],
-            "technical_alignment": {},
-            "problem_area_coverage": {},
-            "evidence_found": [],
-            "confidence": 0.0
-        }
-        
         if not self.openai_client:
             # Fallback to keyword matching if no AI
             return self._analyze_alignment_keyword_based(website_data, solicitation_data)
         
+        skip_reason = self._ai_alignment_skip_reason(website_data)
+        if skip_reason:
+            logger.info(f"Skipping AI alignment for {company_name}: {skip_reason}, using keyword analysis")
+            return self._keyword_alignment_fallback(website_data, solicitation_data)
+        
         try:
-            # Prepare comprehensive website content
-            all_content = f"""
-COMPANY: {company_name}
-
-WEBSITE CONTENT (from {website_data.get('pages_crawled', 1)} pages):
-Title: {website_data.get('title', '')}
-Description: {website_data.get('meta_description', '')}
-Headings: {', '.join(website_data.get('headings', [])[:30])}
-Services: {website_data.get('services', '')[:2000]}
-About: {website_data.get('about', '')[:2000]}
-Main Content: {website_data.get('main_text', '')[:5000]}
-"""
-            
-            # Prepare solicitation requirements
-            required_capabilities = solicitation_data.get("required_capabilities", [])
-            technical_requirements = solicitation_data.get("technical_requirements", [])
-            problem_areas = solicitation_data.get("problem_areas", [])
-            keywords = solicitation_data.get("keywords", [])
-            solicitation_title = solicitation_data.get("title", "")
+            request = self._build_alignment_request(website_data, solicitation_data, company_name)
+            result = await self._chat_completion(**request)
+            return self._finalize_alignment(result, website_data, solicitation_data)
+        except Exception as e:
+            logger.warning(f"AI alignment analysis failed: {e}, using keyword fallback")
+            return self._keyword_alignment_fallback(website_data, solicitation_data)
+    
+    async def analyze_solicitation_alignment_batch(
+        self,
+        companies: List[Dict[str, Any]],
+        solicitation_data: Dict[str, Any],
+        poll_interval: float = 60.0
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Score many companies against one solicitation via the OpenAI Batch API
+        
+        For bulk/offline sweeps only: results may take up to 24h but cost half
+        as much as interactive calls and don't compete for rate limits.
+        
+        Args:
+            companies: Dicts with "name" and crawled "website_data"
+            solicitation_data: Solicitation requirements shared by every company
+            poll_interval: Seconds between batch status checks
+        
+        Returns:
+            Alignment result per company name (keyword fallback for any
+            company the batch did not return a usable answer for)
+        """
+        if not self.openai_client:
+            return {
+                company["name"]: self._analyze_alignment_keyword_based(company["website_data"], solicitation_data)
+                for company in companies
+            }
+        
+        # Thin or unvalidated sites are scored by keywords below rather than sent to the model
+        by_id = {f"company-{idx}": company for idx, company in enumerate(companies)}
+        to_send = {
+            custom_id: company for custom_id, company in by_id.items()
+            if not self._ai_alignment_skip_reason(company["website_data"])
+        }
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_alignment_request(company["website_data"], solicitation_data, company["name"])
+            })
+            for custom_id, company in to_send.items()
+        ]
+        
+        outputs = await self._run_alignment_batch(lines, len(companies), poll_interval) if lines else {}
+        
+        results = {}
+        for custom_id, company in by_id.items():
+            website_data = company["website_data"]
+            if custom_id in outputs:
+                try:
+                    results[company["name"]] = self._finalize_alignment(outputs[custom_id], website_data, solicitation_data)
+                    continue
+                except Exception as e:
+                    logger.warning(f"AI alignment result for {company['name']} unusable: {e}, using keyword fallback")
+            results[company["name"]] = self._keyword_alignment_fallback(website_data, solicitation_data)
+        return results
+    
+    async def _run_alignment_batch(
+        self,
+        lines: List[str],
+        total_companies: int,
+        poll_interval: float
+    ) -> Dict[str, str]:
+        """Submit batch request lines, wait for completion and return response text by custom_id"""
+        outputs: Dict[str, str] = {}
+        try:
+            batch_file = await self.openai_client.files.create(
+                file=("alignment_batch.jsonl", "\n".join(lines).encode()),
+                purpose="batch"
+            )
+            batch = await self.openai_client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"Submitted alignment batch {batch.id} for {len(lines)} of {total_companies} companies")
             
-            solicitation_context = f"""
-SOLICITATION: {solicitation_title}
-
-REQUIRED CAPABILITIES:
-{chr(10).join([f"- {cap}" for cap in required_capabilities[:15]])}
-
-TECHNICAL REQUIREMENTS:
-{chr(10).join([f"- {req}" for req in technical_requirements[:10]])}
-
-PROBLEM AREAS:
-{chr(10).join([f"- {area}" for area in problem_areas[:10]])}
-
-KEYWORDS: {', '.join(keywords[:20])}
-"""
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(poll_interval)
+                batch = await self.openai_client.batches.retrieve(batch.id)
             
-            prompt = f"""Analyze how well this company's website aligns with the solicitation requirements.
-
-{all_content}
+            if batch.status != "completed" or not batch.output_file_id:
+                logger.warning(f"Alignment batch {batch.id} ended with status {batch.status}")
+            else:
+                output = await self.openai_client.files.content(batch.output_file_id)
+                for line in output.text.splitlines():
+                    if not line.strip():
+                        continue
+                    record = _json_loads(line)
+                    body = (record.get("response") or {}).get("body") or {}
+                    choices = body.get("choices") or []
+                    if choices:
+                        outputs[record["custom_id"]] = choices[0]["message"]["content"].strip()
+        except Exception as e:
+            logger.warning(f"AI alignment batch failed: {e}, using keyword fallback")
+        return outputs
+    
+    def _build_alignment_request(
+        self,
+        website_data: Dict[str, Any],
+        solicitation_data: Dict[str, Any],
+        company_name: str
+    ) -> Dict[str, Any]:
+        """Build the chat completion request body for solicitation alignment analysis"""
+        # Prepare comprehensive website content (one join over pre-sliced fields)
+        all_content = "\n".join([
+            "",
+            f"COMPANY: {company_name}",
+            "",
+            f"WEBSITE CONTENT (from {website_data.get('pages_crawled', 1)} pages):",
+            f"Title: {website_data.get('title', '')}",
+            f"Description: {website_data.get('meta_description', '')}",
+            f"Headings: {', '.join(website_data.get('headings', [])[:30])}",
+            f"Services: {website_data.get('services', '')[:2000]}",
+            f"About: {website_data.get('about', '')[:2000]}",
+            f"Main Content: {website_data.get('main_text', '')[:5000]}",
+            "",
+        ])
+        
+        # Prepare solicitation requirements
+        solicitation_context = "\n".join([
+            "",
+            f"SOLICITATION: {solicitation_data.get('title', '')}",
+            "",
+            "REQUIRED CAPABILITIES:",
+            _bullet_list(solicitation_data.get("required_capabilities", [])[:15]),
+            "",
+            "TECHNICAL REQUIREMENTS:",
+            _bullet_list(solicitation_data.get("technical_requirements", [])[:10]),
+            "",
+            "PROBLEM AREAS:",
+            _bullet_list(solicitation_data.get("problem_areas", [])[:10]),
+            "",
+            f"KEYWORDS: {', '.join(solicitation_data.get('keywords', [])[:20])}",
+            "",
+        ])
+        
+        # Static instructions first, then the solicitation (shared by every company
+        # scored against it), then the company's website content last
+        prompt = "\n\n".join([solicitation_context, all_content])
+        
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {"role": "system", "content": """You are an expert at analyzing company websites against government solicitation requirements. Provide detailed, evidence-based analysis.
 
-{solicitation_context}
+Analyze how well the company's website aligns with the solicitation requirements.
 
 Provide a comprehensive analysis:
 1. Which required capabilities are clearly demonstrated on the website? (list specific evidence)
 2. Which required capabilities are missing or unclear? (list gaps)
 3. How well does the website address the problem areas? (rate 0-1.0)
 4. What technical evidence supports their ability to meet requirements? (specific examples)
-5. Overall alignment score (0.0 to 1.0) - how well does the website demonstrate they can meet this solicitation?
-
-Format as JSON with fields:
-- overall_alignment_score (float 0.0-1.0)
-- capability_matches (array of objects with: capability, evidence, confidence)
-- capability_gaps (array of objects with: capability, reason, severity)
-- problem_area_coverage (object with coverage scores for each problem area)
-- technical_evidence (array of specific technical evidence found)
-- confidence (float 0.0-1.0)"""
-            
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are an expert at analyzing company websites against government solicitation requirements. Provide detailed, evidence-based analysis."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2000,
-                temperature=0.3
-            )
-            
-            result = response.choices[0].message.content.strip()
+5. Overall alignment score (0.0 to 1.0) - how well does the website demonstrate they can meet this solicitation?"""},
+                {"role": "user", "content": prompt}
+            ],
+            "response_format": _ALIGNMENT_RESPONSE_FORMAT,
+            "max_tokens": 1200,
+            "temperature": 0.3
+        }
+    
+    def _finalize_alignment(
+        self,
+        result: str,
+        website_data: Dict[str, Any],
+        solicitation_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Parse a structured AI alignment response and apply the hallucination penalty"""
+        try:
+            alignment_result = AlignmentResult.model_validate_json(result).model_dump()
+            # Keep the {problem area: coverage} shape used by the rest of the pipeline
+            alignment_result["problem_area_coverage"] = {
+                item["problem_area"]: item["coverage"] for item in alignment_result["problem_area_coverage"]
+            }
             
-            # Parse JSON response
-            import json
-            if result.startswith("```json"):
-                result = result[7:]
-            if result.startswith("```"):
-                result = result[3:]
-            if result.endswith("```"):
-                result = result[:-3]
-            result = result.strip()
+            # Anti-hallucination check: Validate AI response quality
+            hallucination_penalty = self._detect_hallucinations(alignment_result, website_data, solicitation_data)
+            alignment_result["hallucination_penalty"] = hallucination_penalty
+            alignment_result["content_verified"] = hallucination_penalty < 0.3  # Low penalty = verified
             
-            try:
-                alignment_result = json.loads(result)
-                
-                # Anti-hallucination check: Validate AI response quality
-                hallucination_penalty = self._detect_hallucinations(alignment_result, website_data, solicitation_data)
-                alignment_result["hallucination_penalty"] = hallucination_penalty
-                alignment_result["content_verified"] = hallucination_penalty < 0.3  # Low penalty = verified
-                
-                # Apply penalty to alignment score if hallucinations detected
-                if hallucination_penalty > 0:
-                    original_score = alignment_result.get('overall_alignment_score', 0.0)
-                    alignment_result['overall_alignment_score'] = max(0.0, original_score - hallucination_penalty)
-                    logger.warning(f"⚠ Applied hallucination penalty of {hallucination_penalty:.1%} to alignment score")
-                
-                logger.info(f"✓ Solicitation alignment analysis complete: {alignment_result.get('overall_alignment_score', 0.0):.1%} (penalty: {hallucination_penalty:.1%})")
-            except json.JSONDecodeError:
-                logger.warning("AI returned non-JSON alignment analysis, using keyword fallback")
-                alignment_result = self._analyze_alignment_keyword_based(website_data, solicitation_data)
-                alignment_result["hallucination_penalty"] = 0.0  # No penalty for fallback
-                alignment_result["content_verified"] = True  # Keyword-based is verified
+            # Apply penalty to alignment score if hallucinations detected
+            if hallucination_penalty > 0:
+                original_score = alignment_result.get('overall_alignment_score', 0.0)
+                alignment_result['overall_alignment_score'] = max(0.0, original_score - hallucination_penalty)
+                logger.warning(f"⚠ Applied hallucination penalty of {hallucination_penalty:.1%} to alignment score")
             
-        except Exception as e:
-            logger.warning(f"AI alignment analysis failed: {e}, using keyword fallback")
-            alignment_result = self._analyze_alignment_keyword_based(website_data, solicitation_data)
-            alignment_result["hallucination_penalty"] = 0.0
-            alignment_result["content_verified"] = True
+            logger.info(f"✓ Solicitation alignment analysis complete: {alignment_result.get('overall_alignment_score', 0.0):.1%} (penalty: {hallucination_penalty:.1%})")
+        except ValidationError:
+            # Only reachable on refusals or truncated output; the schema is enforced server-side
+            logger.warning("AI returned unusable alignment analysis, using keyword fallback")
+            alignment_result = self._keyword_alignment_fallback(website_data, solicitation_data)
         
         return alignment_result
     
+    def _keyword_alignment_fallback(
+        self,
+        website_data: Dict[str, Any],
+        solicitation_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Keyword-based alignment used when AI analysis is unavailable, unusable or skipped"""
+        alignment_result = self._analyze_alignment_keyword_based(website_data, solicitation_data)
+        alignment_result["hallucination_penalty"] = 0.0  # No penalty for fallback
+        # Keyword matches come from the crawled text itself, so they're as verified as that text
+        alignment_result["content_verified"] = website_data.get("content_validated", True)
+        return alignment_result
+    
+    @staticmethod
+    def _ai_alignment_skip_reason(website_data: Dict[str, Any]) -> Optional[str]:
+        """Why AI alignment output would be discarded for this content, or None to call the model"""
+        if not website_data.get("content_validated", False):
+            return "website content not validated"
+        content_length = website_data.get("total_content_length", 0)
+        if content_length < _MIN_AI_CONTENT_LENGTH:
+            return f"only {content_length} chars of content"
+        return None
+    
+    @staticmethod
+    def _joined_website_text(website_data: Dict[str, Any]) -> str:
+        """
+        Lowercased title, description, main text, services, about and headings
+        
+        Built once per crawl and stored as website_data["_joined_lower"] so the
+        keyword, gap and hallucination checks don't each re-join and re-lower it.
+        """
+        joined = website_data.get("_joined_lower")
+        if joined is None:
+            main_text_lower = website_data.get("main_text_lower") or website_data.get("main_text", "").lower()
+            joined = " ".join([
+                website_data.get("title", "").lower(),
+                website_data.get("meta_description", "").lower(),
+                main_text_lower,
+                website_data.get("services", "").lower(),
+                website_data.get("about", "").lower(),
+                " ".join(website_data.get("headings", [])).lower()
+            ])
+            website_data["_joined_lower"] = joined
+        return joined
+    
     def _detect_hallucinations(
         self,
         alignment_result: Dict[str, Any],
@@ -851,12 +1748,7 @@ Format as JSON with fields:
         
         # Check 1: Verify capability matches have evidence in actual website content
         capability_matches = alignment_result.get("capability_matches", [])
-        website_text = " ".join([
-            website_data.get("main_text", ""),
-            website_data.get("services", ""),
-            website_data.get("about", ""),
-            " ".join(website_data.get("headings", []))
-        ]).lower()
+        website_text = self._joined_website_text(website_data)
         
         unverified_matches = 0
         for match in capability_matches:
@@ -868,7 +1760,7 @@ Format as JSON with fields:
             found_in_content = any(term in website_text for term in capability_terms)
             
             # Check if evidence mentions specific website content
-            evidence_has_website_refs = any(ref in evidence for ref in ["page", "section", "website", "site", "content"])
+            evidence_has_website_refs = _EVIDENCE_REF_RE.search(evidence) is not None
             
             if not found_in_content and not evidence_has_website_refs:
                 unverified_matches += 1
@@ -885,9 +1777,8 @@ Format as JSON with fields:
             vague_evidence = 0
             for evidence in technical_evidence:
                 evidence_text = str(evidence).lower()
-                # Vague indicators (likely hallucinated)
-                vague_terms = ["generally", "likely", "probably", "may", "could", "appears", "seems"]
-                if any(term in evidence_text for term in vague_terms):
+                # Vague indicators (likely hallucinated), matched as whole words by hashing
+                if not _VAGUE_EVIDENCE_TERMS.isdisjoint(evidence_text.translate(_PUNCTUATION_TO_SPACE).split()):
                     vague_evidence += 1
             
             vague_ratio = vague_evidence / len(technical_evidence) if technical_evidence else 0
@@ -900,7 +1791,7 @@ Format as JSON with fields:
         content_length = website_data.get("total_content_length", 0)
         
         # If alignment score is very high but content is minimal, likely hallucinated
-        if alignment_score > 0.8 and content_length < 1000:
+        if alignment_score > 0.8 and content_length < _MIN_AI_CONTENT_LENGTH:
             penalty += 0.3
             logger.warning(f"Hallucination check: High alignment score ({alignment_score:.1%}) with minimal content ({content_length} chars)")
         
@@ -914,15 +1805,9 @@ Format as JSON with fields:
         evidence_found = alignment_result.get("evidence_found", [])
         if evidence_found:
             generic_evidence = 0
-            generic_phrases = [
-                "the website mentions",
-                "according to the website",
-                "the company offers",
-                "based on the content"
-            ]
             for evidence in evidence_found:
                 evidence_str = str(evidence).lower()
-                if any(phrase in evidence_str for phrase in generic_phrases):
+                if _GENERIC_EVIDENCE_RE.search(evidence_str):
                     generic_evidence += 1
             
             generic_ratio = generic_evidence / len(evidence_found) if evidence_found else 0
@@ -943,22 +1828,23 @@ Format as JSON with fields:
         keywords = solicitation_data.get("keywords", [])
         
         # Combine all website text
-        all_text = " ".join([
-            website_data.get("title", ""),
-            website_data.get("meta_description", ""),
-            website_data.get("main_text", ""),
-            website_data.get("services", ""),
-            website_data.get("about", ""),
-            " ".join(website_data.get("headings", []))
-        ]).lower()
+        all_text = self._joined_website_text(website_data)
         
         capability_matches = []
         capability_gaps = []
         
+        # Find every capability phrase and significant word in one scan of the text
+        needles = set()
+        for cap in required_capabilities:
+            cap_lower = cap.lower()
+            needles.add(cap_lower)
+            needles.update(word for word in cap_lower.split() if len(word) > 4)
+        text_hits = _find_terms(all_text, needles)
+        
         for cap in required_capabilities:
             cap_lower = cap.lower()
             # Check if capability or its keywords appear in website
-            if cap_lower in all_text or any(word in all_text for word in cap_lower.split() if len(word) > 4):
+            if cap_lower in text_hits or any(word in text_hits for word in cap_lower.split() if len(word) > 4):
                 capability_matches.append({
                     "capability": cap,
                     "evidence": "Found in website content",
@@ -992,37 +1878,19 @@ Format as JSON with fields:
         capabilities = []
         
         # Combine relevant text from all pages
-        text = " ".join([
-            website_data.get("title", ""),
-            website_data.get("meta_description", ""),
-            website_data.get("services", ""),
-            website_data.get("about", ""),
-            website_data.get("main_text", "")[:10000],  # Include main text from all pages
-            " ".join(website_data.get("headings", []))
-        ]).lower()
-        
-        # Common capability keywords
-        capability_patterns = {
-            "software development": ["software development", "custom software", "application development"],
-            "cloud computing": ["cloud", "aws", "azure", "gcp", "cloud computing"],
-            "cybersecurity": ["cybersecurity", "cyber security", "information security", "infosec"],
-            "data analytics": ["data analytics", "data analysis", "business intelligence", "big data"],
-            "artificial intelligence": ["artificial intelligence", "ai", "machine learning", "ml", "deep learning"],
-            "devops": ["devops", "ci/cd", "continuous integration"],
-            "mobile development": ["mobile app", "ios", "android", "mobile development"],
-            "web development": ["web development", "website", "web application"],
-            "consulting": ["consulting", "advisory", "strategic consulting"],
-            "systems integration": ["systems integration", "integration services"],
-            "it infrastructure": ["it infrastructure", "infrastructure management"],
-            "research": ["research", "r&d", "research and development"],
-            "engineering": ["engineering", "hardware engineering", "systems engineering"],
-        }
+        text = self._joined_website_text(website_data)
         
-        for capability, keywords in capability_patterns.items():
-            for keyword in keywords:
-                if keyword in text:
+        if ahocorasick is not None:
+            # One automaton pass for every capability keyword, then map hits back
+            text_hits = _find_terms(text, _ALL_CAPABILITY_KEYWORDS, _CAPABILITY_KEYWORD_AUTOMATON)
+            for capability, keywords in _CAPABILITY_KEYWORDS.items():
+                if any(keyword in text_hits for keyword in keywords):
+                    capabilities.append(capability.title())
+        else:
+            # Substring search beats a regex alternation here; each category stops at its first hit
+            for capability, keywords in _CAPABILITY_KEYWORDS.items():
+                if any(keyword in text for keyword in keywords):
                     capabilities.append(capability.title())
-                    break
         
         return capabilities
     
@@ -1037,44 +1905,36 @@ Format as JSON with fields:
             pages_crawled = website_data.get('pages_crawled', 1)
             
             # Prepare comprehensive website content from all pages
-            content = f"""
-Company: {company_name}
-Pages Crawled: {pages_crawled}
-
-Title: {website_data.get('title', '')}
-Description: {website_data.get('meta_description', '')}
-Services: {website_data.get('services', '')[:2000]}
-About: {website_data.get('about', '')[:2000]}
-Headings: {', '.join(website_data.get('headings', [])[:30])}
-Main Content (sample): {website_data.get('main_text', '')[:3000]}
-"""
-            
-            prompt = f"""Analyze this company website (crawled from {pages_crawled} pages) and extract their key capabilities and service offerings.
-
-{content}
-
-List 10-15 specific capabilities this company offers based on ALL the content from multiple pages. Be comprehensive and specific.
-Format as a simple comma-separated list."""
-            
-            prompt = f"""Analyze this company website content and extract their key capabilities and service offerings.
-
-{content}
-
-List 5-10 specific capabilities this company offers. Be concise and specific.
-Format as a simple comma-separated list."""
+            prompt = "\n".join([
+                f"Company website content (crawled from {pages_crawled} pages):",
+                "",
+                f"Company: {company_name}",
+                f"Pages Crawled: {pages_crawled}",
+                "",
+                f"Title: {website_data.get('title', '')}",
+                f"Description: {website_data.get('meta_description', '')}",
+                f"Services: {website_data.get('services', '')[:2000]}",
+                f"About: {website_data.get('about', '')[:2000]}",
+                f"Headings: {', '.join(website_data.get('headings', [])[:30])}",
+                f"Main Content (sample): {website_data.get('main_text', '')[:3000]}",
+                "",
+            ])
             
-            response = self.openai_client.chat.completions.create(
+            # temperature=0 keeps extraction deterministic so repeat content hits the cache
+            result = await self._chat_completion(
                 model="gpt-4o-mini",
                 messages=[
-                    {"role": "system", "content": "You are an expert at analyzing company websites and identifying their core capabilities. Analyze comprehensively across all pages."},
+                    {"role": "system", "content": """You are an expert at analyzing company websites and identifying their core capabilities. Analyze comprehensively across all pages.
+
+Extract the company's key capabilities and service offerings from the website content provided.
+List 10-15 specific capabilities this company offers based on ALL the content from multiple pages. Be comprehensive and specific.
+Format as a simple comma-separated list."""},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=400,
-                temperature=0.3
+                temperature=0
             )
             
-            result = response.choices[0].message.content.strip()
-            
             # Parse comma-separated capabilities
             capabilities = [cap.strip() for cap in result.split(',')]
             # Clean up any numbering or bullets
@@ -1092,9 +1952,16 @@ Format as a simple comma-separated list."""
         company_data: Dict[str, Any],
         website_capabilities: List[str],
         solicitation_data: Dict[str, Any],
-        website_data: Dict[str, Any]
+        website_data: Dict[str, Any],
+        capability_tokens: Optional[Dict[str, FrozenSet[str]]] = None
     ) -> List[WebsiteGap]:
-        """Identify gaps between claimed capabilities and website"""
+        """
+        Identify gaps between claimed capabilities and website
+        
+        Capability names are compared as token sets (see
+        _identify_confirmed_capabilities); claims are also searched for in the
+        full crawled text.
+        """
         
         gaps = []
         
@@ -1102,39 +1969,41 @@ Format as a simple comma-separated list."""
         claimed_capabilities = company_data.get("capabilities", [])
         required_capabilities = solicitation_data.get("required_capabilities", [])
         
-        # Convert to lowercase for comparison
-        website_caps_lower = set(cap.lower() for cap in website_capabilities)
+        # Token sets for comparison, computed once per capability list
+        if capability_tokens is None:
+            capability_tokens = self._tokenize_capabilities(website_capabilities)
+        website_token_sets = set(tokens for tokens in capability_tokens.values() if tokens)
+        claimed_tokens = self._tokenize_capabilities(claimed_capabilities)
+        claimed_token_sets = set(tokens for tokens in claimed_tokens.values() if tokens)
+        required_tokens = self._tokenize_capabilities(required_capabilities)
+        required_token_sets = set(tokens for tokens in required_tokens.values() if tokens)
+        
+        all_website_text = self._joined_website_text(website_data)
+        claimed_certs = company_data.get("certifications", [])
+        
+        # Find every claimed phrase, significant claim word and certification in one scan
+        needles = {cert.lower() for cert in claimed_certs}
+        for claimed_cap in claimed_capabilities:
+            claimed_lower = claimed_cap.lower()
+            needles.add(claimed_lower)
+            needles.update(word for word in claimed_lower.split() if len(word) > 4)
+        text_hits = _find_terms(all_website_text, needles)
         
         # Check for capability mismatches (using all crawled content)
         for claimed_cap in claimed_capabilities:
             claimed_lower = claimed_cap.lower()
             
             # Check if this capability is mentioned on website
-            found_on_website = False
-            for website_cap in website_caps_lower:
-                # Fuzzy matching - check for substring or similar keywords
-                if claimed_lower in website_cap or website_cap in claimed_lower:
-                    found_on_website = True
-                    break
+            found_on_website = _tokens_match(claimed_tokens[claimed_cap], website_token_sets)
             
             if not found_on_website:
                 # Check in all website text from all crawled pages
-                all_website_text = " ".join([
-                    website_data.get("main_text", ""),
-                    website_data.get("services", ""),
-                    website_data.get("about", ""),
-                    " ".join(website_data.get("headings", []))
-                ]).lower()
-                
-                if claimed_lower in all_website_text or any(word in all_website_text for word in claimed_lower.split() if len(word) > 4):
+                if claimed_lower in text_hits or any(word in text_hits for word in claimed_lower.split() if len(word) > 4):
                     found_on_website = True
             
             if not found_on_website:
                 # Calculate severity based on whether it's required
-                is_required = any(
-                    claimed_lower in req.lower() or req.lower() in claimed_lower
-                    for req in required_capabilities
-                )
+                is_required = _tokens_match(claimed_tokens[claimed_cap], required_token_sets)
                 severity = 0.8 if is_required else 0.5
                 
                 gaps.append(WebsiteGap(
@@ -1146,18 +2015,12 @@ Format as a simple comma-separated list."""
                 ))
         
         # Check for required capabilities missing from both claims and website
-        claimed_caps_lower = set(cap.lower() for cap in claimed_capabilities)
-        
         for req_cap in required_capabilities:
-            req_lower = req_cap.lower()
-            
-            # Check if it's in claimed capabilities
-            in_claimed = any(req_lower in claimed or claimed in req_lower 
-                           for claimed in claimed_caps_lower)
+            req_tokens = required_tokens[req_cap]
             
-            # Check if it's on website
-            in_website = any(req_lower in website or website in req_lower 
-                           for website in website_caps_lower)
+            # Check if it's in claimed capabilities or on website
+            in_claimed = _tokens_match(req_tokens, claimed_token_sets)
+            in_website = _tokens_match(req_tokens, website_token_sets)
             
             if not in_claimed and not in_website:
                 gaps.append(WebsiteGap(
@@ -1169,11 +2032,8 @@ Format as a simple comma-separated list."""
                 ))
         
         # Check for certifications mentioned in profile but not on website
-        claimed_certs = company_data.get("certifications", [])
-        website_text = website_data.get("main_text", "").lower()
-        
         for cert in claimed_certs:
-            if cert.lower() not in website_text:
+            if cert.lower() not in text_hits:
                 gaps.append(WebsiteGap(
                     gap_type=GapType.CERTIFICATION_UNVERIFIED,
                     description=f"Certification '{cert}' claimed but not verified on website",
@@ -1184,43 +2044,47 @@ Format as a simple comma-separated list."""
         
         return gaps
     
+    def _tokenize_capabilities(self, capabilities: List[str]) -> Dict[str, FrozenSet[str]]:
+        """Map each capability name to its normalized token set (computed once per company)"""
+        return {cap: _capability_tokens(cap) for cap in capabilities}
+    
     def _identify_confirmed_capabilities(
         self,
         company_data: Dict[str, Any],
-        website_capabilities: List[str]
+        website_capabilities: List[str],
+        capability_tokens: Optional[Dict[str, FrozenSet[str]]] = None
     ) -> List[str]:
-        """Identify capabilities that are confirmed by website"""
+        """
+        Identify capabilities that are confirmed by website
+        
+        A claim is confirmed when its tokens contain, or are contained in, the
+        tokens of a website capability (token-level form of substring matching).
+        """
         
         confirmed = []
         claimed_capabilities = company_data.get("capabilities", [])
         
-        website_caps_lower = set(cap.lower() for cap in website_capabilities)
+        if capability_tokens is None:
+            capability_tokens = self._tokenize_capabilities(website_capabilities)
+        website_token_sets = set(tokens for tokens in capability_tokens.values() if tokens)
         
         for claimed_cap in claimed_capabilities:
-            claimed_lower = claimed_cap.lower()
-            
-            # Check for match
-            for website_cap in website_caps_lower:
-                if claimed_lower in website_cap or website_cap in claimed_lower:
-                    confirmed.append(claimed_cap)
-                    break
+            if _tokens_match(_capability_tokens(claimed_cap), website_token_sets):
+                confirmed.append(claimed_cap)
         
         return confirmed
     
     async def _generate_partnering_opportunities(
         self,
-        gaps: List[WebsiteGap],
+        critical_gaps: List[WebsiteGap],
         company_data: Dict[str, Any],
         solicitation_data: Dict[str, Any],
         website_capabilities: List[str]
     ) -> List[Dict[str, Any]]:
-        """Generate partnering opportunity suggestions based on gaps"""
+        """Generate partnering opportunity suggestions for the critical gaps"""
         
         opportunities = []
         
-        # Focus on high-severity gaps that represent real capability shortfalls
-        critical_gaps = [gap for gap in gaps if gap.severity >= 0.7]
-        
         if not critical_gaps:
             return opportunities
         
@@ -1228,7 +2092,6 @@ Format as a simple comma-separated list."""
         if self.openai_client:
             opportunities = await self._generate_partnering_opportunities_with_ai(
                 critical_gaps,
-                company_data,
                 solicitation_data,
                 website_capabilities
             )
@@ -1255,16 +2118,31 @@ Format as a simple comma-separated list."""
     async def _generate_partnering_opportunities_with_ai(
         self,
         gaps: List[WebsiteGap],
-        company_data: Dict[str, Any],
         solicitation_data: Dict[str, Any],
         website_capabilities: List[str]
     ) -> List[Dict[str, Any]]:
-        """Use AI to generate smart partnering opportunity suggestions"""
+        """
+        Use AI to generate smart partnering opportunity suggestions
+        
+        The prompt is built from the solicitation, the gaps and the verified
+        website capabilities (never the company name), so companies with the
+        same gaps and capabilities against the same solicitation share one
+        cached answer instead of paying for a call each.
+        """
         
         try:
-            company_name = company_data.get("name", "the company")
             solicitation_title = solicitation_data.get("title", "this solicitation")
             
+            signature = json.dumps([
+                solicitation_title,
+                sorted((gap.gap_type.value, gap.description, gap.severity) for gap in gaps),
+                sorted({cap.lower() for cap in website_capabilities}),
+            ])
+            cache_key = hashlib.sha256(signature.encode()).hexdigest()
+            cached = self._cache_get(self._partnering_cache, cache_key)
+            if cached is not None:
+                return [dict(opp) for opp in cached]
+            
             gaps_description = "\n".join([
                 f"- {gap.description} (Severity: {gap.severity:.0%})"
                 for gap in gaps
@@ -1272,39 +2150,33 @@ Format as a simple comma-separated list."""
             
             website_caps_str = ", ".join(website_capabilities) if website_capabilities else "None identified"
             
-            prompt = f"""Analyze gaps between a company's profile and their website to suggest partnering opportunities.
-
-Company: {company_name}
-Solicitation: {solicitation_title}
+            # Solicitation first so calls for the same solicitation share a prompt prefix
+            prompt = f"""Solicitation: {solicitation_title}
 
 Identified Gaps:
 {gaps_description}
 
 Verified Website Capabilities:
-{website_caps_str}
+{website_caps_str}"""
+            
+            content = await self._chat_completion(
+                stream_json=True,
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": """You are an expert in government contracting and strategic partnerships. Provide actionable, specific suggestions.
 
-Based on these gaps, suggest 2-4 specific partnering opportunities that would strengthen their bid. For each opportunity:
+You will be given gaps between a company's profile and their website. Based on these gaps, suggest 2-4 specific partnering opportunities that would strengthen their bid. For each opportunity:
 1. What type of partner they should seek (specific capability/expertise)
 2. Why this partnership would be strategic
 3. Priority level (Critical/High/Medium)
 
-Format as JSON array with fields: gap, partner_type, rationale, priority"""
-            
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert in government contracting and strategic partnerships. Provide actionable, specific suggestions."},
+Format as JSON array with fields: gap, partner_type, rationale, priority"""},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=800,
                 temperature=0.7
             )
             
-            content = response.choices[0].message.content.strip()
-            
-            # Try to parse as JSON
-            import json
-            
             # Remove markdown code blocks if present
             if content.startswith("```json"):
                 content = content[7:]
@@ -1315,7 +2187,7 @@ Format as JSON array with fields: gap, partner_type, rationale, priority"""
             content = content.strip()
             
             try:
-                opportunities = json.loads(content)
+                opportunities = _json_loads(content)
                 
                 # Validate and format
                 formatted_opportunities = []
@@ -1328,12 +2200,13 @@ Format as JSON array with fields: gap, partner_type, rationale, priority"""
                             "priority": opp.get("priority", "Medium")
                         })
                 
-                return formatted_opportunities
-                
             except json.JSONDecodeError:
                 logger.warning("AI returned non-JSON partnering suggestions")
                 # Fall back to text parsing
-                return self._parse_opportunities_from_text(content, gaps)
+                formatted_opportunities = self._parse_opportunities_from_text(content, gaps)
+            
+            self._cache_put(self._partnering_cache, cache_key, formatted_opportunities)
+            return [dict(opp) for opp in formatted_opportunities]
             
         except Exception as e:
             logger.warning(f"AI partnering opportunity generation failed: {e}")
@@ -1372,7 +2245,7 @@ Format as JSON array with fields: gap, partner_type, rationale, priority"""
     ) -> float:
         """Calculate overall validation score (0.0 to 1.0)"""
         
-        claimed_capabilities = company_data.get("capabilities", [])
+        claimed_capabilities = company_data.get("capabilities", ())
         
         if not claimed_capabilities:
             # If no claimed capabilities, use solicitation alignment if available
@@ -1383,6 +2256,10 @@ Format as JSON array with fields: gap, partner_type, rationale, priority"""
         # Base score from confirmation rate
         confirmation_rate = len(confirmed_capabilities) / len(claimed_capabilities)
         
+        if not gaps and not solicitation_alignment:
+            # No penalty and nothing to blend: the formula reduces to rate * 0.7 + 0.3
+            return 1.0 if confirmation_rate >= 1.0 else confirmation_rate * 0.7 + 0.3
+        
         # Penalty for gaps (weighted by severity)
         if gaps:
             avg_gap_severity = sum(gap.severity for gap in gaps) / len(gaps)
@@ -1401,14 +2278,14 @@ Format as JSON array with fields: gap, partner_type, rationale, priority"""
         else:
             score = base_score
         
-        return max(0.0, min(1.0, score))  # Clamp to [0, 1]
+        return 0.0 if score < 0.0 else 1.0 if score > 1.0 else score  # Clamp to [0, 1]
     
     def _generate_summary(
         self,
         company_name: str,
         validation_score: float,
         confirmed_capabilities: List[str],
-        gaps: List[WebsiteGap],
+        critical_gaps: List[WebsiteGap],
         partnering_opportunities: List[Dict[str, Any]],
         website_data: Optional[Dict[str, Any]] = None,
         solicitation_alignment: Optional[Dict[str, Any]] = None
@@ -1416,52 +2293,50 @@ Format as JSON array with fields: gap, partner_type, rationale, priority"""
         """Generate human-readable summary with deep crawl information"""
         
         parts = []
+        append = parts.append
         
         # Pages crawled info
         pages_crawled = website_data.get("pages_crawled", 1) if website_data else 1
         if pages_crawled > 1:
-            parts.append(f"🔍 DEEP CRAWL: Analyzed {pages_crawled} pages")
+            append(f"🔍 DEEP CRAWL: Analyzed {pages_crawled} pages")
         
         # Score assessment
-        if validation_score >= 0.8:
-            parts.append(f"✓ STRONG VALIDATION ({validation_score:.0%})")
-        elif validation_score >= 0.6:
-            parts.append(f"⚠ MODERATE VALIDATION ({validation_score:.0%})")
-        else:
-            parts.append(f"✗ WEAK VALIDATION ({validation_score:.0%})")
+        band = (validation_score >= 0.6) + (validation_score >= 0.8)
+        append(_SCORE_TEMPLATES[band] % (validation_score * 100))
         
         # Solicitation alignment if available
         if solicitation_alignment:
             alignment_score = solicitation_alignment.get("overall_alignment_score", 0.0)
-            parts.append(f"\n📋 SOLICITATION ALIGNMENT: {alignment_score:.0%}")
+            append(f"\n📋 SOLICITATION ALIGNMENT: {alignment_score:.0%}")
             
-            matches = solicitation_alignment.get("capability_matches", [])
+            matches = solicitation_alignment.get("capability_matches", ())
             if matches:
-                parts.append(f"  ✓ {len(matches)} required capabilities confirmed on website")
+                append(f"  ✓ {len(matches)} required capabilities confirmed on website")
             
-            gaps_list = solicitation_alignment.get("capability_gaps", [])
+            gaps_list = solicitation_alignment.get("capability_gaps", ())
             if gaps_list:
-                parts.append(f"  ⚠ {len(gaps_list)} required capabilities not found")
+                append(f"  ⚠ {len(gaps_list)} required capabilities not found")
         
         # Confirmed capabilities
         if confirmed_capabilities:
-            parts.append(f"\n✅ CONFIRMED CAPABILITIES ({len(confirmed_capabilities)}): {', '.join(confirmed_capabilities[:3])}")
-            if len(confirmed_capabilities) > 3:
-                parts.append(f" + {len(confirmed_capabilities) - 3} more")
+            confirmed_count = len(confirmed_capabilities)
+            append(f"\n✅ CONFIRMED CAPABILITIES ({confirmed_count}): {', '.join(islice(confirmed_capabilities, 3))}")
+            if confirmed_count > 3:
+                append(f" + {confirmed_count - 3} more")
         
-        # Gaps
-        if gaps:
-            critical_gaps = [g for g in gaps if g.severity >= 0.7]
-            if critical_gaps:
-                parts.append(f"\n\n⚠️ CRITICAL GAPS FOUND ({len(critical_gaps)}):")
-                for gap in critical_gaps[:3]:
-                    parts.append(f"\n  • {gap.description}")
+        extend = parts.extend
+        
+        # Critical gaps
+        if critical_gaps:
+            extend((_SUMMARY_CRITICAL_GAPS, str(len(critical_gaps)), _SUMMARY_COUNT_END))
+            for gap in islice(critical_gaps, 3):
+                extend((_SUMMARY_BULLET, gap.description))
         
         # Partnering opportunities
         if partnering_opportunities:
-            parts.append(f"\n\n🤝 PARTNERING OPPORTUNITIES ({len(partnering_opportunities)}):")
-            for opp in partnering_opportunities[:3]:
-                parts.append(f"\n  • {opp.get('opportunity_type', 'Partnership')}: {opp.get('suggestion', '')[:100]}")
+            extend((_SUMMARY_PARTNERING, str(len(partnering_opportunities)), _SUMMARY_COUNT_END))
+            for opp in islice(partnering_opportunities, 3):
+                extend((_SUMMARY_BULLET, opp.get('opportunity_type', 'Partnership'), ": ", opp.get('suggestion', '')[:100]))
         
         return "".join(parts)
     
@@ -1473,25 +2348,15 @@ Format as JSON array with fields: gap, partner_type, rationale, priority"""
     ) -> WebsiteValidationResult:
         """Create result for company with no website"""
         
-        gaps = [
-            WebsiteGap(
-                gap_type=GapType.MARKET_FOCUS_DIFFERENT,
-                description="No website available for validation",
-                claimed_value="Website expected",
-                website_value="None",
-                severity=0.7
-            )
-        ]
-        
         return WebsiteValidationResult(
             company_name=company_name,
             website_url="",
             website_accessible=False,
             validation_score=0.3,
-            gaps_found=gaps,
-            confirmed_capabilities=[],
-            website_capabilities=[],
-            partnering_opportunities=[],
+            gaps_found=_NO_WEBSITE_GAPS,
+            confirmed_capabilities=_EMPTY_CAPS,
+            website_capabilities=_EMPTY_CAPS,
+            partnering_opportunities=_EMPTY_OPPORTUNITIES,
             summary=f"⚠ NO WEBSITE - Cannot validate {company_name} claims against website"
         )
     
@@ -1504,15 +2369,15 @@ Format as JSON array with fields: gap, partner_type, rationale, priority"""
     ) -> WebsiteValidationResult:
         """Create result for inaccessible website"""
         
-        gaps = [
+        gaps = (
             WebsiteGap(
                 gap_type=GapType.MARKET_FOCUS_DIFFERENT,
                 description=f"Website {website_url} is not accessible",
                 claimed_value="Accessible website",
                 website_value="Inaccessible",
                 severity=0.6
-            )
-        ]
+            ),
+        )
         
         return WebsiteValidationResult(
             company_name=company_name,
@@ -1520,9 +2385,9 @@ Format as JSON array with fields: gap, partner_type, rationale, priority"""
             website_accessible=False,
             validation_score=0.4,
             gaps_found=gaps,
-            confirmed_capabilities=[],
-            website_capabilities=[],
-            partnering_opportunities=[],
+            confirmed_capabilities=_EMPTY_CAPS,
+            website_capabilities=_EMPTY_CAPS,
+            partnering_opportunities=_EMPTY_OPPORTUNITIES,
             summary=f"⚠ WEBSITE INACCESSIBLE - Cannot validate {company_name} against {website_url}"
         )
     
@@ -1535,15 +2400,15 @@ Format as JSON array with fields: gap, partner_type, rationale, priority"""
     ) -> WebsiteValidationResult:
         """Create result for website with invalid/unverified content (anti-hallucination)"""
         
-        gaps = [
+        gaps = (
             WebsiteGap(
                 gap_type=GapType.MARKET_FOCUS_DIFFERENT,
                 description=f"Website {website_url} content failed validation (insufficient/boilerplate content)",
                 claimed_value="Valid website content",
                 website_value="Invalid/unverified content",
                 severity=0.8  # High severity - we can't trust unverified content
-            )
-        ]
+            ),
+        )
         
         return WebsiteValidationResult(
             company_name=company_name,
@@ -1551,9 +2416,9 @@ Format as JSON array with fields: gap, partner_type, rationale, priority"""
             website_accessible=False,  # Mark as inaccessible since content is invalid
             validation_score=0.2,  # Low score for unverified content
             gaps_found=gaps,
-            confirmed_capabilities=[],
-            website_capabilities=[],
-            partnering_opportunities=[],
+            confirmed_capabilities=_EMPTY_CAPS,
+            website_capabilities=_EMPTY_CAPS,
+            partnering_opportunities=_EMPTY_OPPORTUNITIES,
             summary=f"⚠ CONTENT NOT VERIFIED - Website content for {company_name} failed validation checks (anti-hallucination safeguard)"
         )
 